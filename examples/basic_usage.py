@@ -5,12 +5,14 @@ Note: These examples assume the MCP server is running and configured.
 """
 
 import asyncio
+import io
 import json
 
 
 async def example_space_management():
     """Example: Create and manage a Genie space."""
-    print("=== Space Management Example ===\n")
+    out = io.StringIO()
+    print("=== Space Management Example ===\n", file=out)
 
     # Example configuration
     config = {
@@ -40,7 +42,7 @@ async def example_space_management():
         "warehouse_id": "your-warehouse-id",
     }
 
-    print(f"Configuration to create:\n{json.dumps(config, indent=2)}\n")
+    print(f"Configuration to create:\n{json.dumps(config, indent=2)}\n", file=out)
 
     # In practice, you would call the MCP tool:
     # result = create_genie_space(
@@ -50,16 +52,19 @@ async def example_space_management():
     # )
     # print(f"Created space: {result}")
 
+    return out.getvalue()
+
 
 async def example_querying():
     """Example: Ask questions to Genie."""
-    print("\n=== Querying Example ===\n")
+    out = io.StringIO()
+    print("\n=== Querying Example ===\n", file=out)
 
     space_id = "your-space-id"
     question = "What were the top 10 selling products last week?"
 
-    print(f"Space ID: {space_id}")
-    print(f"Question: {question}\n")
+    print(f"Space ID: {space_id}", file=out)
+    print(f"Question: {question}\n", file=out)
 
     # In practice, you would call the MCP tool:
     # result = await ask_genie(
@@ -72,10 +77,13 @@ async def example_querying():
     # print(f"SQL Query: {result_dict['sql_query']}")
     # print(f"Results: {result_dict['query_result']}")
 
+    return out.getvalue()
+
 
 async def example_config_generation():
     """Example: Generate configuration from requirements."""
-    print("\n=== Configuration Generation Example ===\n")
+    out = io.StringIO()
+    print("\n=== Configuration Generation Example ===\n", file=out)
 
     requirements = """
     Create a Genie space for analyzing customer orders in an e-commerce platform.
@@ -99,7 +107,7 @@ async def example_config_generation():
     - Product conversion rate
     """
 
-    print(f"Requirements:\n{requirements}\n")
+    print(f"Requirements:\n{requirements}\n", file=out)
 
     # In practice, you would call the MCP tool:
     # result = generate_space_config(
@@ -114,18 +122,21 @@ async def example_config_generation():
     # print(f"Confidence Score: {result_dict['confidence_score']}")
     # print(f"Validation Score: {result_dict['validation_report']['score']}/100")
 
+    return out.getvalue()
+
 
 async def example_table_metadata():
     """Example: Extract table metadata for context."""
-    print("\n=== Table Metadata Extraction Example ===\n")
+    out = io.StringIO()
+    print("\n=== Table Metadata Extraction Example ===\n", file=out)
 
     catalog_name = "main"
     schema_name = "sales"
     table_names = ["orders", "customers", "products"]
 
-    print(f"Catalog: {catalog_name}")
-    print(f"Schema: {schema_name}")
-    print(f"Tables: {', '.join(table_names)}\n")
+    print(f"Catalog: {catalog_name}", file=out)
+    print(f"Schema: {schema_name}", file=out)
+    print(f"Tables: {', '.join(table_names)}\n", file=out)
 
     # In practice, you would call the MCP tool:
     # result = extract_table_metadata(
@@ -140,16 +151,24 @@ async def example_table_metadata():
     #     print(f"  Columns: {len(table['columns'])}")
     #     print(f"  Type: {table['table_type']}")
 
+    return out.getvalue()
+
 
 async def main():
     """Run all examples."""
     print("Genie MCP Server - Usage Examples")
     print("=" * 50)
 
-    await example_space_management()
-    await example_querying()
-    await example_config_generation()
-    await example_table_metadata()
+    # Examples are independent, so run them concurrently; each buffers its own
+    # output and gather() returns them in order, keeping the printout stable
+    outputs = await asyncio.gather(
+        example_space_management(),
+        example_querying(),
+        example_config_generation(),
+        example_table_metadata(),
+    )
+    for output in outputs:
+        print(output, end="")
 
     print("\n" + "=" * 50)
     print("Note: These are example templates. Uncomment the MCP tool calls")
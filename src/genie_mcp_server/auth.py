@@ -1,8 +1,10 @@
 """Databricks authentication utilities."""
 
+from functools import lru_cache
+
 from databricks.sdk import WorkspaceClient
 
-from genie_mcp_server.config import DatabricksConfig
+from genie_mcp_server.config import DatabricksConfig, get_databricks_config
 
 
 def create_workspace_client(config: DatabricksConfig) -> WorkspaceClient:
@@ -30,3 +32,16 @@ def create_workspace_client(config: DatabricksConfig) -> WorkspaceClient:
     else:
         # Use default auth (Databricks CLI config)
         return WorkspaceClient(host=config.host)
+
+
+@lru_cache(maxsize=1)
+def get_workspace_client() -> WorkspaceClient:
+    """Return the process-wide workspace client.
+
+    Built once from get_databricks_config() so every caller shares the same
+    authenticated session and HTTP connection pool.
+
+    Returns:
+        Authenticated WorkspaceClient instance
+    """
+    return create_workspace_client(get_databricks_config())
@@ -0,0 +1,334 @@
+"""Async Databricks Genie API client over a pooled HTTP connection."""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+import httpx
+
+from genie_mcp_server.client.genie_client import (
+    SPACE_SUMMARY_FIELDS,
+    SpaceCache,
+    SpaceConfigInput,
+    coerce_space_config,
+    copy_listing,
+    serialize_space_config,
+)
+from genie_mcp_server.utils.error_handling import translate_databricks_error
+from genie_mcp_server.utils.json_utils import dumps_bytes, loads
+
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+
+SPACES_PATH = "/api/2.0/genie/spaces"
+
+
+class AsyncGenieClient:
+    """Async client for Genie space operations using the Databricks REST API.
+
+    Holds a single pooled ``httpx.AsyncClient`` for the lifetime of the server so
+    concurrent tool calls share keep-alive connections instead of blocking a
+    worker thread per request. Authentication headers come from the workspace
+    client's config, so PAT, OAuth M2M and CLI auth all work unchanged.
+    """
+
+    def __init__(
+        self,
+        workspace_client: "WorkspaceClient",
+        cache: Optional[SpaceCache] = None,
+        max_keepalive_connections: int = 50,
+        max_connections: int = 100,
+        timeout_seconds: float = 60.0,
+    ):
+        """Initialize async Genie client.
+
+        Args:
+            workspace_client: Authenticated Databricks workspace client
+            cache: Optional space cache to share with other clients
+            max_keepalive_connections: Maximum idle connections kept in the pool
+            max_connections: Maximum concurrent connections
+            timeout_seconds: Per-request timeout in seconds
+        """
+        self.config = workspace_client.config
+        self.http = httpx.AsyncClient(
+            base_url=self.config.host,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive_connections,
+                max_connections=max_connections,
+            ),
+            timeout=timeout_seconds,
+        )
+        self.cache = cache or SpaceCache()
+
+    def invalidate(self, space_id: Optional[str] = None) -> None:
+        """Invalidate cached space metadata.
+
+        Args:
+            space_id: Space to invalidate; invalidates everything if None
+        """
+        self.cache.invalidate(space_id)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        body: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Send an authenticated request and return the decoded JSON body.
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+        """
+        headers = {"Accept": "application/json", **self.config.authenticate()}
+        if self.config.workspace_id:
+            headers["X-Databricks-Workspace-Id"] = self.config.workspace_id
+
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+
+        content = None
+        if body is not None:
+            content = dumps_bytes(body)
+            headers["Content-Type"] = "application/json"
+
+        response = await self.http.request(
+            method, path, params=params, content=content, headers=headers
+        )
+        if response.is_error:
+            raise httpx.HTTPStatusError(
+                f"{response.status_code} {response.reason_phrase}: {response.text}",
+                request=response.request,
+                response=response,
+            )
+
+        return loads(response.content) if response.content else {}
+
+    async def create_space(
+        self,
+        warehouse_id: str,
+        config: SpaceConfigInput,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        parent_path: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Create a new Genie space with AI configuration.
+
+        Args:
+            warehouse_id: SQL warehouse ID for query execution
+            config: Genie space configuration (instructions, tables, examples, etc.),
+                either a GenieSpaceConfig or its JSON
+            title: Optional space title (defaults to config.space_name)
+            description: Optional space description (defaults to config.description)
+            parent_path: Optional parent path in workspace
+
+        Returns:
+            Dictionary with created space details
+
+        Raises:
+            GenieError: If space creation fails
+        """
+        config = coerce_space_config(config)
+
+        try:
+            body = {
+                "warehouse_id": warehouse_id,
+                "serialized_space": serialize_space_config(config),
+                "title": title if title is not None else config.space_name,
+                "description": description if description is not None else config.description,
+            }
+            if parent_path is not None:
+                body["parent_path"] = parent_path
+
+            space = await self._request("POST", SPACES_PATH, body=body)
+            self.cache.listings.clear()
+
+            return {
+                "space_id": space.get("space_id"),
+                "title": space.get("title"),
+                "description": space.get("description"),
+                "warehouse_id": space.get("warehouse_id"),
+                "owner_user_id": space.get("owner_user_id"),
+                "created_timestamp": space.get("created_timestamp"),
+            }
+        except Exception as e:
+            raise translate_databricks_error(e)
+
+    async def list_spaces(
+        self, page_size: Optional[int] = None, page_token: Optional[str] = None
+    ) -> dict[str, Any]:
+        """List all Genie spaces.
+
+        Args:
+            page_size: Number of spaces to return per page
+            page_token: Token for pagination
+
+        Returns:
+            Dictionary with spaces array and optional next_page_token. Each
+            call returns a fresh copy, so it is safe to modify
+
+        Raises:
+            GenieError: If listing fails
+        """
+        key = (page_size, page_token)
+        try:
+            return copy_listing(self.cache.listings[key])
+        except KeyError:
+            pass
+
+        try:
+            result = await self._request(
+                "GET", SPACES_PATH, params={"page_size": page_size, "page_token": page_token}
+            )
+
+            spaces = [
+                {field: space.get(field) for field in SPACE_SUMMARY_FIELDS}
+                for space in result.get("spaces") or []
+            ]
+
+            listing = {"spaces": spaces, "next_page_token": result.get("next_page_token")}
+            self.cache.listings[key] = listing
+            return copy_listing(listing)
+        except Exception as e:
+            raise translate_databricks_error(e)
+
+    async def list_all_spaces(self, page_size: int = 200) -> list[dict[str, Any]]:
+        """List every Genie space by following pagination to the last page.
+
+        Page tokens are opaque cursors handed out one page at a time, so pages
+        are fetched in order; a large page size keeps the number of round-trips
+        low. Each page goes through the list_spaces cache.
+
+        Args:
+            page_size: Number of spaces to request per page
+
+        Returns:
+            List of space summaries across all pages
+
+        Raises:
+            GenieError: If listing fails
+        """
+        spaces: list[dict[str, Any]] = []
+        page_token = None
+
+        while True:
+            listing = await self.list_spaces(page_size=page_size, page_token=page_token)
+            spaces.extend(listing["spaces"])
+            page_token = listing["next_page_token"]
+            if not page_token:
+                return spaces
+
+    async def get_space(
+        self, space_id: str, include_serialized_space: bool = False
+    ) -> dict[str, Any]:
+        """Get details of a specific Genie space.
+
+        Args:
+            space_id: Space identifier
+            include_serialized_space: Whether to include the full Protobuf configuration
+
+        Returns:
+            Dictionary with space details. Each call returns a fresh copy, so
+            it is safe to modify
+
+        Raises:
+            GenieError: If space not found or retrieval fails
+        """
+        key = (space_id, include_serialized_space)
+        try:
+            return dict(self.cache.spaces[key])
+        except KeyError:
+            pass
+
+        try:
+            params = {"include_serialized_space": "true"} if include_serialized_space else None
+            space = await self._request("GET", f"{SPACES_PATH}/{space_id}", params=params)
+
+            result = {
+                "space_id": space.get("space_id"),
+                "title": space.get("title"),
+                "description": space.get("description"),
+                "warehouse_id": space.get("warehouse_id"),
+                "owner_user_id": space.get("owner_user_id"),
+                "created_timestamp": space.get("created_timestamp"),
+                "updated_timestamp": space.get("updated_timestamp"),
+            }
+
+            if include_serialized_space:
+                result["serialized_space"] = space.get("serialized_space")
+
+            self.cache.spaces[key] = result
+            return dict(result)
+        except Exception as e:
+            raise translate_databricks_error(e)
+
+    async def update_space(
+        self,
+        space_id: str,
+        config: Optional[SpaceConfigInput] = None,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Update an existing Genie space.
+
+        Args:
+            space_id: Space identifier
+            config: Optional new Genie space configuration, as a GenieSpaceConfig or JSON
+            title: Optional new title
+            description: Optional new description
+            warehouse_id: Optional new warehouse ID
+
+        Returns:
+            Dictionary with updated space details
+
+        Raises:
+            GenieError: If space not found or update fails
+        """
+        if config is not None:
+            config = coerce_space_config(config)
+
+        try:
+            body: dict[str, Any] = {}
+            if config:
+                body["serialized_space"] = serialize_space_config(config)
+            if title is not None:
+                body["title"] = title
+            if description is not None:
+                body["description"] = description
+            if warehouse_id is not None:
+                body["warehouse_id"] = warehouse_id
+
+            space = await self._request("PATCH", f"{SPACES_PATH}/{space_id}", body=body)
+            self.cache.invalidate(space_id)
+
+            return {
+                "space_id": space.get("space_id"),
+                "title": space.get("title"),
+                "description": space.get("description"),
+                "warehouse_id": space.get("warehouse_id"),
+                "updated_timestamp": space.get("updated_timestamp"),
+            }
+        except Exception as e:
+            raise translate_databricks_error(e)
+
+    async def delete_space(self, space_id: str) -> dict[str, str]:
+        """Delete a Genie space (soft delete - moves to trash).
+
+        Args:
+            space_id: Space identifier
+
+        Returns:
+            Dictionary with success message
+
+        Raises:
+            GenieError: If space not found or deletion fails
+        """
+        try:
+            await self._request("DELETE", f"{SPACES_PATH}/{space_id}")
+            self.cache.invalidate(space_id)
+            return {"status": "success", "message": f"Space {space_id} deleted successfully"}
+        except Exception as e:
+            raise translate_databricks_error(e)
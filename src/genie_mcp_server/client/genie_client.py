@@ -1,31 +1,137 @@
 """Databricks Genie API client wrapper."""
 
-import json
-from typing import Any, Optional
-
-from databricks.sdk import WorkspaceClient
+import logging
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from genie_mcp_server.models.protobuf_format import config_to_protobuf
-from genie_mcp_server.models.space import GenieSpaceConfig
+from genie_mcp_server.models.space import GenieSpaceConfig, parse_space_config
+from genie_mcp_server.utils.cache import TTLCache
 from genie_mcp_server.utils.error_handling import translate_databricks_error
 
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+
+logger = logging.getLogger(__name__)
+
+
+SpaceConfigInput = Union[GenieSpaceConfig, str, bytes]
+
+
+def coerce_space_config(config: SpaceConfigInput) -> GenieSpaceConfig:
+    """Return config as a GenieSpaceConfig, parsing it if given as JSON.
+
+    Args:
+        config: GenieSpaceConfig instance, or its JSON as str or bytes
+
+    Returns:
+        GenieSpaceConfig instance
+
+    Raises:
+        pydantic.ValidationError: If the JSON is not a valid configuration
+    """
+    if isinstance(config, GenieSpaceConfig):
+        return config
+    return parse_space_config(config)
+
+
+def serialize_space_config(config: GenieSpaceConfig) -> str:
+    """Convert a GenieSpaceConfig to the serialized_space payload sent to the API.
+
+    At DEBUG level, also logs the payload size next to the size of the plain
+    GenieSpaceConfig JSON for comparison.
+
+    Args:
+        config: Genie space configuration
+
+    Returns:
+        JSON string in Databricks Protobuf format (version 2)
+    """
+    serialized_space = config_to_protobuf(config)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "serialized_space: %d bytes (GenieSpaceConfig JSON: %d bytes)",
+            len(serialized_space.encode("utf-8")),
+            len(config.model_dump_json().encode("utf-8")),
+        )
+    return serialized_space
+
+
+# Fields returned for each space in a listing
+SPACE_SUMMARY_FIELDS = ("space_id", "title", "description", "warehouse_id")
+_space_summary = attrgetter(*SPACE_SUMMARY_FIELDS)
+
+
+def copy_listing(listing: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached list_spaces result so callers cannot modify the cache entry.
+
+    Space summaries hold only scalars, so copying each dict is enough.
+    """
+    return {
+        "spaces": [dict(space) for space in listing["spaces"]],
+        "next_page_token": listing["next_page_token"],
+    }
+
+
+class SpaceCache:
+    """Short-lived caches for space metadata.
+
+    A single instance is shared by the sync and async Genie clients so a write
+    through either one invalidates what the other has cached.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl_seconds: float = 60.0):
+        """Initialize space caches.
+
+        Args:
+            maxsize: Maximum entries per cache
+            ttl_seconds: Time-to-live for cached responses in seconds
+        """
+        # Keyed by (space_id, include_serialized_space)
+        self.spaces = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        # Keyed by (page_size, page_token)
+        self.listings = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    def invalidate(self, space_id: Optional[str] = None) -> None:
+        """Drop cached entries for one space (or all spaces) and every cached listing.
+
+        Args:
+            space_id: Space to invalidate; invalidates all spaces if None
+        """
+        if space_id is None:
+            self.spaces.clear()
+        else:
+            for include_serialized_space in (False, True):
+                self.spaces.pop((space_id, include_serialized_space), None)
+        self.listings.clear()
+
 
 class GenieClient:
     """Wrapper around Databricks SDK for Genie API operations."""
 
-    def __init__(self, workspace_client: WorkspaceClient):
+    def __init__(self, workspace_client: "WorkspaceClient", cache: Optional[SpaceCache] = None):
         """Initialize Genie client.
 
         Args:
             workspace_client: Authenticated Databricks workspace client
+            cache: Optional space cache to share with other clients
         """
         self.client = workspace_client
         self.genie = workspace_client.genie
+        self.cache = cache or SpaceCache()
+
+    def invalidate(self, space_id: Optional[str] = None) -> None:
+        """Invalidate cached space metadata.
+
+        Args:
+            space_id: Space to invalidate; invalidates everything if None
+        """
+        self.cache.invalidate(space_id)
 
     def create_space(
         self,
         warehouse_id: str,
-        config: GenieSpaceConfig,
+        config: SpaceConfigInput,
         title: Optional[str] = None,
         description: Optional[str] = None,
         parent_path: Optional[str] = None,
@@ -34,7 +140,8 @@ class GenieClient:
 
         Args:
             warehouse_id: SQL warehouse ID for query execution
-            config: Genie space configuration (instructions, tables, examples, etc.)
+            config: Genie space configuration (instructions, tables, examples, etc.),
+                either a GenieSpaceConfig or its JSON
             title: Optional space title (defaults to config.space_name)
             description: Optional space description (defaults to config.description)
             parent_path: Optional parent path in workspace
@@ -50,9 +157,11 @@ class GenieClient:
             before being sent to the API. This format includes data_sources, sample_questions,
             and text_instructions.
         """
+        config = coerce_space_config(config)
+
         try:
             # Convert our user-friendly config to Databricks Protobuf format
-            serialized_space = config_to_protobuf(config)
+            serialized_space = serialize_space_config(config)
 
             # Use config values as defaults if not explicitly provided
             if title is None:
@@ -66,6 +175,7 @@ class GenieClient:
                 title=title,
                 description=description,
             )
+            self.cache.listings.clear()
 
             return {
                 "space_id": space.space_id,
@@ -88,32 +198,33 @@ class GenieClient:
             page_token: Token for pagination
 
         Returns:
-            Dictionary with spaces array and optional next_page_token
+            Dictionary with spaces array and optional next_page_token. Each
+            call returns a fresh copy, so it is safe to modify
 
         Raises:
             GenieError: If listing fails
         """
+        key = (page_size, page_token)
+        try:
+            return copy_listing(self.cache.listings[key])
+        except KeyError:
+            pass
+
         try:
             result = self.genie.list_spaces(page_size=page_size, page_token=page_token)
 
-            spaces = []
-            for space in result.spaces or []:
-                spaces.append(
-                    {
-                        "space_id": space.space_id,
-                        "title": space.title,
-                        "description": space.description,
-                        "warehouse_id": space.warehouse_id,
-                    }
-                )
-
-            return {"spaces": spaces, "next_page_token": result.next_page_token}
+            spaces = [
+                dict(zip(SPACE_SUMMARY_FIELDS, _space_summary(space)))
+                for space in result.spaces or []
+            ]
+
+            listing = {"spaces": spaces, "next_page_token": result.next_page_token}
+            self.cache.listings[key] = listing
+            return copy_listing(listing)
         except Exception as e:
             raise translate_databricks_error(e)
 
-    def get_space(
-        self, space_id: str, include_serialized_space: bool = False
-    ) -> dict[str, Any]:
+    def get_space(self, space_id: str, include_serialized_space: bool = False) -> dict[str, Any]:
         """Get details of a specific Genie space.
 
         Args:
@@ -121,11 +232,18 @@ class GenieClient:
             include_serialized_space: Whether to include the full Protobuf configuration
 
         Returns:
-            Dictionary with space details
+            Dictionary with space details. Each call returns a fresh copy, so
+            it is safe to modify
 
         Raises:
             GenieError: If space not found or retrieval fails
         """
+        key = (space_id, include_serialized_space)
+        try:
+            return dict(self.cache.spaces[key])
+        except KeyError:
+            pass
+
         try:
             space = self.genie.get_space(
                 space_id=space_id, include_serialized_space=include_serialized_space
@@ -144,14 +262,15 @@ class GenieClient:
             if include_serialized_space:
                 result["serialized_space"] = space.serialized_space
 
-            return result
+            self.cache.spaces[key] = result
+            return dict(result)
         except Exception as e:
             raise translate_databricks_error(e)
 
     def update_space(
         self,
         space_id: str,
-        config: Optional[GenieSpaceConfig] = None,
+        config: Optional[SpaceConfigInput] = None,
         title: Optional[str] = None,
         description: Optional[str] = None,
         warehouse_id: Optional[str] = None,
@@ -160,7 +279,7 @@ class GenieClient:
 
         Args:
             space_id: Space identifier
-            config: Optional new Genie space configuration
+            config: Optional new Genie space configuration, as a GenieSpaceConfig or JSON
             title: Optional new title
             description: Optional new description
             warehouse_id: Optional new warehouse ID
@@ -174,10 +293,13 @@ class GenieClient:
         Note:
             If config is provided, it will be converted to Databricks Protobuf format.
         """
+        if config is not None:
+            config = coerce_space_config(config)
+
         try:
             serialized_space = None
             if config:
-                serialized_space = config_to_protobuf(config)
+                serialized_space = serialize_space_config(config)
 
             space = self.genie.update_space(
                 space_id=space_id,
@@ -186,6 +308,7 @@ class GenieClient:
                 description=description,
                 warehouse_id=warehouse_id,
             )
+            self.cache.invalidate(space_id)
 
             return {
                 "space_id": space.space_id,
@@ -211,6 +334,7 @@ class GenieClient:
         """
         try:
             self.genie.trash_space(space_id=space_id)
+            self.cache.invalidate(space_id)
             return {"status": "success", "message": f"Space {space_id} deleted successfully"}
         except Exception as e:
             raise translate_databricks_error(e)
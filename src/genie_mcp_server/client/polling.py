@@ -1,21 +1,35 @@
 """Async polling utilities for long-running operations."""
 
 import asyncio
-import time
-from typing import Any, Callable
+import inspect
+import random
+from collections.abc import Awaitable, Callable
+from typing import Any, Union
+
+CheckFn = Callable[[], Union[tuple[bool, Any], Awaitable[tuple[bool, Any]]]]
 
 
 async def poll_until_complete(
-    check_fn: Callable[[], tuple[bool, Any]],
+    check_fn: CheckFn,
     timeout_seconds: int = 300,
-    poll_interval_seconds: int = 2,
+    poll_interval_seconds: float = 0.5,
+    max_interval_seconds: float = 10.0,
+    backoff_factor: float = 1.5,
 ) -> Any:
     """Poll a function until it completes or times out.
 
+    The wait between polls starts at ``poll_interval_seconds`` and grows
+    exponentially (with a small jitter) up to ``max_interval_seconds``, so short
+    queries return quickly while long ones make far fewer API calls.
+
     Args:
-        check_fn: Synchronous function that returns (is_complete, result)
+        check_fn: Sync or async function that returns (is_complete, result).
+            Sync functions are run in a worker thread so the event loop stays
+            responsive during blocking SDK calls.
         timeout_seconds: Maximum time to wait before timing out
-        poll_interval_seconds: Time to wait between polls
+        poll_interval_seconds: Initial time to wait between polls
+        max_interval_seconds: Upper bound for the wait between polls
+        backoff_factor: Multiplier applied to the wait after each incomplete poll
 
     Returns:
         The result from check_fn when is_complete is True
@@ -23,19 +37,29 @@ async def poll_until_complete(
     Raises:
         TimeoutError: If the operation times out
     """
-    start_time = time.time()
+    is_async = inspect.iscoroutinefunction(check_fn)
+
+    async def _poll() -> Any:
+        interval = poll_interval_seconds
 
-    while True:
-        is_complete, result = check_fn()
+        while True:
+            if is_async:
+                is_complete, result = await check_fn()
+            else:
+                is_complete, result = await asyncio.to_thread(check_fn)
 
-        if is_complete:
-            return result
+            if is_complete:
+                return result
 
-        elapsed = time.time() - start_time
-        if elapsed >= timeout_seconds:
-            raise asyncio.TimeoutError(
-                f"Operation timed out after {timeout_seconds} seconds. "
-                f"Consider increasing timeout_seconds parameter."
-            )
+            await asyncio.sleep(interval + random.uniform(0, interval * 0.1))
+            interval = min(interval * backoff_factor, max_interval_seconds)
 
-        await asyncio.sleep(poll_interval_seconds)
+    try:
+        # wait_for cancels the in-flight check/sleep at the deadline instead of
+        # waiting for the next wakeup
+        return await asyncio.wait_for(_poll(), timeout=timeout_seconds)
+    except asyncio.TimeoutError:
+        raise asyncio.TimeoutError(
+            f"Operation timed out after {timeout_seconds} seconds. "
+            f"Consider increasing timeout_seconds parameter."
+        ) from None
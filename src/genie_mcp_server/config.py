@@ -1,5 +1,7 @@
 """Configuration management for Genie MCP Server."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,15 +21,29 @@ class DatabricksConfig(BaseSettings):
     timeout_seconds: int = 300
     poll_interval_seconds: int = 2
     max_retries: int = 3
-    serving_endpoint_name: str | None = None  # Optional: only needed for deprecated generate_space_config tool
+    serving_endpoint_name: str | None = (
+        None  # Optional: only needed for deprecated generate_space_config tool
+    )
+    serving_prompt_caching: bool = (
+        False  # Mark the static prompt prefix cacheable (Anthropic models)
+    )
+    query_results_volume_path: str | None = (
+        None  # Optional: /Volumes/... dir for large query results
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="DATABRICKS_",
         env_file=".env",
         env_file_encoding="utf-8",
+        frozen=True,
     )
 
 
+@lru_cache(maxsize=1)
 def get_databricks_config() -> DatabricksConfig:
-    """Load and return Databricks configuration from environment variables."""
+    """Load and return Databricks configuration from environment variables.
+
+    The configuration is read once per process; call
+    ``get_databricks_config.cache_clear()`` to reload it.
+    """
     return DatabricksConfig()
@@ -1,5 +1,8 @@
 """LLM prompt templates for Genie space configuration generation."""
 
+from string import Template
+from typing import Any
+
 BEST_PRACTICES = """
 ## Best Practices for Genie Space Configuration
 
@@ -117,6 +120,41 @@ You must output valid JSON matching this schema:
 """
 
 
+# Stable prompt prefix, identical for every request
+CONFIG_GENERATION_PROMPT_HEAD = f"""You are an expert in creating Databricks Genie spaces. Generate a complete, high-quality Genie space configuration based on the user's requirements.
+
+{BEST_PRACTICES}
+
+{OUTPUT_FORMAT}
+
+"""
+
+_CONFIG_GENERATION_PROMPT_HEAD_BYTES = CONFIG_GENERATION_PROMPT_HEAD.encode("utf-8")
+
+_CONFIG_GENERATION_PROMPT_TAIL = Template("""${table_context}
+
+## Configuration Parameters
+
+- Catalog: ${catalog_name}
+- Warehouse ID: ${warehouse_id}
+
+## User Requirements
+
+${requirements}
+
+## Task
+
+Generate a complete Genie space configuration that:
+1. Addresses all user requirements
+2. Follows best practices for instructions, SQL, and structure
+3. Includes at least 3-5 example SQL queries
+4. Uses specific column/table names (backticks in instructions)
+5. Provides clear, actionable guidance
+
+Respond ONLY with valid JSON matching the schema above.
+""")
+
+
 def build_config_generation_prompt(
     requirements: str,
     catalog_name: str,
@@ -134,46 +172,104 @@ def build_config_generation_prompt(
     Returns:
         Formatted prompt string
     """
-    table_context = ""
-    if table_metadata:
-        table_context = f"""
-## Available Table Metadata
+    return CONFIG_GENERATION_PROMPT_HEAD + _render_config_generation_prompt_tail(
+        requirements, catalog_name, warehouse_id, table_metadata
+    )
 
-{table_metadata}
 
-Use this metadata to understand table structures, columns, and relationships.
-"""
+def build_config_generation_prompt_bytes(
+    requirements: str,
+    catalog_name: str,
+    warehouse_id: str,
+    table_metadata: str | None = None,
+) -> bytes:
+    """Build the config generation prompt as UTF-8 bytes.
 
-    prompt = f"""You are an expert in creating Databricks Genie spaces. Generate a complete, high-quality Genie space configuration based on the user's requirements.
+    Only the per-request tail is encoded; the static head is encoded once at import.
 
-{BEST_PRACTICES}
+    Args:
+        requirements: User's natural language requirements
+        catalog_name: Unity Catalog name
+        warehouse_id: SQL warehouse ID
+        table_metadata: Optional table metadata context
 
-{OUTPUT_FORMAT}
+    Returns:
+        UTF-8 encoded prompt, identical to build_config_generation_prompt(...).encode()
+    """
+    tail = _render_config_generation_prompt_tail(
+        requirements, catalog_name, warehouse_id, table_metadata
+    )
+    return _CONFIG_GENERATION_PROMPT_HEAD_BYTES + tail.encode("utf-8")
 
-{table_context}
 
-## Configuration Parameters
+def build_config_generation_messages(
+    requirements: str,
+    catalog_name: str,
+    warehouse_id: str,
+    table_metadata: str | None = None,
+    cache_prefix: bool = False,
+) -> list[dict[str, Any]]:
+    """Build chat messages for generating a Genie space configuration.
 
-- Catalog: {catalog_name}
-- Warehouse ID: {warehouse_id}
+    The static instructions go in a system message and the request-specific
+    part in a user message, so endpoints with prompt-prefix caching can reuse
+    the shared prefix across requests.
 
-## User Requirements
+    Args:
+        requirements: User's natural language requirements
+        catalog_name: Unity Catalog name
+        warehouse_id: SQL warehouse ID
+        table_metadata: Optional table metadata context
+        cache_prefix: Mark the system message with an ephemeral cache_control
+            breakpoint (for Anthropic models behind the serving endpoint)
+
+    Returns:
+        List of chat messages
+    """
+    system_content: str | list[dict[str, Any]] = CONFIG_GENERATION_PROMPT_HEAD
+    if cache_prefix:
+        system_content = [
+            {
+                "type": "text",
+                "text": CONFIG_GENERATION_PROMPT_HEAD,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    return [
+        {"role": "system", "content": system_content},
+        {
+            "role": "user",
+            "content": _render_config_generation_prompt_tail(
+                requirements, catalog_name, warehouse_id, table_metadata
+            ),
+        },
+    ]
 
-{requirements}
 
-## Task
+def _render_config_generation_prompt_tail(
+    requirements: str,
+    catalog_name: str,
+    warehouse_id: str,
+    table_metadata: str | None,
+) -> str:
+    """Render the request-specific part of the config generation prompt."""
+    table_context = ""
+    if table_metadata:
+        table_context = f"""
+## Available Table Metadata
 
-Generate a complete Genie space configuration that:
-1. Addresses all user requirements
-2. Follows best practices for instructions, SQL, and structure
-3. Includes at least 3-5 example SQL queries
-4. Uses specific column/table names (backticks in instructions)
-5. Provides clear, actionable guidance
+{table_metadata}
 
-Respond ONLY with valid JSON matching the schema above.
+Use this metadata to understand table structures, columns, and relationships.
 """
 
-    return prompt
+    return _CONFIG_GENERATION_PROMPT_TAIL.substitute(
+        table_context=table_context,
+        catalog_name=catalog_name,
+        warehouse_id=warehouse_id,
+        requirements=requirements,
+    )
 
 
 def build_table_metadata_prompt(
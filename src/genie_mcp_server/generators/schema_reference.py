@@ -0,0 +1,104 @@
+"""On-disk schema reference so config generation can skip live metadata discovery."""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+DEFAULT_SCHEMA_REFERENCE_PATH = ".genie/schema.md"
+SCHEMA_REFERENCE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+_HEADER_PREFIX = "# Schema Reference: "
+
+
+def render_schema_reference(
+    catalog_name: str, schema_name: str, tables: list[dict[str, Any]]
+) -> str:
+    """Render table metadata as a compact Markdown quick-reference.
+
+    Args:
+        catalog_name: Catalog name in Unity Catalog
+        schema_name: Schema name in Unity Catalog
+        tables: Table metadata dictionaries as returned by extract_table_metadata
+
+    Returns:
+        Markdown document with one row per table
+    """
+    lines = [
+        f"{_HEADER_PREFIX}{catalog_name}.{schema_name}",
+        "",
+        "## Quick Reference",
+        "",
+        "| Table | Full Name | Columns |",
+        "| --- | --- | --- |",
+    ]
+    for table in tables:
+        name = table["table_name"]
+        columns = ", ".join(f"{col['name']} ({col['type']})" for col in table["columns"])
+        lines.append(f"| {name} | `{catalog_name}.{schema_name}.{name}` | {columns} |")
+
+    described = [table for table in tables if table.get("comment")]
+    if described:
+        lines.extend(["", "## Table Descriptions", ""])
+        lines.extend(f"- `{table['table_name']}`: {table['comment']}" for table in described)
+
+    return "\n".join(lines) + "\n"
+
+
+def write_schema_reference(
+    content: str, out_path: Union[str, Path] = DEFAULT_SCHEMA_REFERENCE_PATH
+) -> Path:
+    """Atomically write a schema reference file.
+
+    Args:
+        content: Rendered schema reference
+        out_path: Destination path
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(out_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    return path
+
+
+def load_schema_reference(
+    catalog_name: str,
+    schema_name: str,
+    path: Union[str, Path] = DEFAULT_SCHEMA_REFERENCE_PATH,
+    max_age_seconds: float = SCHEMA_REFERENCE_MAX_AGE_SECONDS,
+) -> Optional[str]:
+    """Load a schema reference if one exists and is fresh.
+
+    Args:
+        catalog_name: Catalog the reference must have been built for
+        schema_name: Schema the reference must have been built for
+        path: Schema reference path
+        max_age_seconds: References older than this are treated as stale
+
+    Returns:
+        Reference contents, or None if missing, stale, or for another schema
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    if time.time() - path.stat().st_mtime > max_age_seconds:
+        return None
+
+    content = path.read_text(encoding="utf-8")
+    header, _, _ = content.partition("\n")
+    if header != f"{_HEADER_PREFIX}{catalog_name}.{schema_name}":
+        return None
+
+    return content
@@ -1,25 +1,70 @@
 """LLM-powered Genie space configuration generator."""
 
-import json
+import asyncio
+import hashlib
+import logging
+import random
 import re
-from typing import Any, Optional
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Optional
 
 import httpx
-from databricks.sdk import WorkspaceClient
+from pydantic import TypeAdapter, ValidationError
 
-from genie_mcp_server.generators.prompts import build_config_generation_prompt
+from genie_mcp_server.generators.prompts import build_config_generation_messages
 from genie_mcp_server.models.space import LLMResponse
+from genie_mcp_server.utils.cache import TTLCache
 from genie_mcp_server.utils.error_handling import LLMError
+from genie_mcp_server.utils.json_utils import JSONDecodeError, dumps_bytes, loads
+
+if TYPE_CHECKING:
+    # databricks.sdk is slow to import and only needed here for annotations
+    from databricks.sdk import WorkspaceClient
+    from databricks.sdk.service.serving import ServingEndpointDetailed
+
+logger = logging.getLogger(__name__)
+
+# Highest sampling temperature whose responses are cached
+CACHEABLE_TEMPERATURE = 0.2
+
+_LLM_RESPONSE_ADAPTER: TypeAdapter[LLMResponse] = TypeAdapter(LLMResponse)
+
+# Constant parts of the chat completion request body
+_REQUEST_BODY_PREFIX = b'{"messages":'
+_REQUEST_BODY_TEMPERATURE = b',"temperature":'
+_REQUEST_BODY_SUFFIX = b',"max_tokens":4000,"stream":true}'
+
+# Start of the config payload: the brace opening a fenced json block, or the
+# object carrying the genie_space_config key
+_PAYLOAD_START_RE = re.compile(r'```(?:json)?[ \t]*\r?\n\s*(\{)|(\{)\s*"genie_space_config"')
 
 
 class GenieConfigGenerator:
     """Generates Genie space configurations using LLM."""
 
+    __slots__ = (
+        "client",
+        "serving_endpoint_name",
+        "max_retries",
+        "prompt_caching",
+        "invocation_url",
+        "endpoint",
+        "response_cache",
+        "http",
+        "ahttp",
+        "inflight",
+        "ainflight",
+        "inflight_lock",
+    )
+
     def __init__(
         self,
-        workspace_client: WorkspaceClient,
+        workspace_client: "WorkspaceClient",
         serving_endpoint_name: str = "databricks-dbrx-instruct",
         max_retries: int = 3,
+        prompt_caching: bool = False,
     ):
         """Initialize the config generator.
 
@@ -27,10 +72,43 @@ class GenieConfigGenerator:
             workspace_client: Authenticated Databricks workspace client
             serving_endpoint_name: Name of the serving endpoint to use
             max_retries: Maximum number of retry attempts
+            prompt_caching: Mark the static prompt prefix with cache_control
+                (supported by Anthropic models on Databricks serving endpoints)
         """
         self.client = workspace_client
         self.serving_endpoint_name = serving_endpoint_name
         self.max_retries = max_retries
+        self.prompt_caching = prompt_caching
+        self.invocation_url = (
+            f"{workspace_client.config.host}/serving-endpoints/{serving_endpoint_name}/invocations"
+        )
+        # Serving endpoint details, looked up on first call
+        self.endpoint: Optional[ServingEndpointDetailed] = None
+        # Parsed responses for low-temperature prompts, keyed by prompt hash
+        self.response_cache = TTLCache(maxsize=256, ttl_seconds=3600.0)
+        # Pooled HTTP clients so retries and repeat generations reuse connections
+        self.http = httpx.Client(timeout=120.0)
+        self.ahttp = httpx.AsyncClient(timeout=120.0)
+        # Generations in progress, keyed like response_cache, so concurrent
+        # identical requests share one LLM call
+        self.inflight: dict[str, Future[LLMResponse]] = {}
+        self.ainflight: dict[str, asyncio.Task[LLMResponse]] = {}
+        self.inflight_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the pooled sync HTTP client."""
+        self.http.close()
+
+    async def aclose(self) -> None:
+        """Close both pooled HTTP clients."""
+        self.http.close()
+        await self.ahttp.aclose()
+
+    def __enter__(self) -> "GenieConfigGenerator":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def generate_config(
         self,
@@ -39,15 +117,22 @@ class GenieConfigGenerator:
         warehouse_id: str,
         table_metadata: Optional[str] = None,
         temperature: float = 0.7,
+        refresh: bool = False,
     ) -> LLMResponse:
         """Generate a Genie space configuration from requirements.
 
+        Responses for temperatures up to CACHEABLE_TEMPERATURE are cached for an
+        hour per prompt, so repeated identical requests skip the LLM call.
+        Identical cacheable requests that arrive while one is still running
+        wait for it instead of calling the LLM again.
+
         Args:
             requirements: Natural language description of desired space
             catalog_name: Unity Catalog name
             warehouse_id: SQL warehouse ID
             table_metadata: Optional table metadata context
             temperature: LLM temperature (0-1, lower = more deterministic)
+            refresh: Ignore any cached response and call the LLM
 
         Returns:
             LLMResponse with generated configuration and reasoning
@@ -56,32 +141,168 @@ class GenieConfigGenerator:
             LLMError: If generation fails
         """
         # Build prompt
-        prompt = build_config_generation_prompt(
+        messages = build_config_generation_messages(
             requirements=requirements,
             catalog_name=catalog_name,
             warehouse_id=warehouse_id,
             table_metadata=table_metadata,
+            cache_prefix=self.prompt_caching,
         )
 
-        # Call LLM with retries
+        # Serialized once and spliced into the request body on every attempt
+        messages_json = dumps_bytes(messages)
+
+        cache_key = _response_cache_key(messages_json, temperature)
+        cached = self._cached_response(cache_key, refresh)
+        if cached is not None:
+            return cached
+
+        if cache_key is None:
+            return self._generate(messages_json, warehouse_id, temperature, cache_key)
+
+        with self.inflight_lock:
+            future = self.inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = self.inflight[cache_key] = Future()
+        if not leader:
+            return future.result().model_copy(deep=True)
+
+        try:
+            llm_response = self._generate(messages_json, warehouse_id, temperature, cache_key)
+            future.set_result(llm_response)
+            return llm_response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.inflight_lock:
+                del self.inflight[cache_key]
+
+    def _generate(
+        self,
+        messages_json: bytes,
+        warehouse_id: str,
+        temperature: float,
+        cache_key: Optional[str],
+    ) -> LLMResponse:
+        """Call the LLM with retries and cache the parsed response."""
         for attempt in range(self.max_retries):
             try:
-                response = self._call_llm(prompt, temperature)
+                response = self._call_llm(messages_json, temperature)
                 llm_response = self._parse_response(response, warehouse_id)
+                self._cache_response(cache_key, llm_response)
+                return llm_response
+            except Exception as e:
+                retry, bump_temperature = _classify_failure(e)
+                if not retry or attempt == self.max_retries - 1:
+                    raise LLMError(
+                        f"Failed to generate config after {attempt + 1} attempts: {str(e)}"
+                    )
+                # Only malformed output benefits from a different sample
+                if bump_temperature:
+                    temperature = min(1.0, temperature + 0.1)
+                time.sleep(_retry_delay(attempt))
+
+        raise LLMError("Unexpected error in config generation")
+
+    async def agenerate_config(
+        self,
+        requirements: str,
+        catalog_name: str,
+        warehouse_id: str,
+        table_metadata: Optional[str] = None,
+        temperature: float = 0.7,
+        refresh: bool = False,
+    ) -> LLMResponse:
+        """Async variant of generate_config.
+
+        The endpoint call runs on the event loop, so concurrent generations
+        overlap their LLM latency instead of each holding a worker thread.
+
+        Raises:
+            LLMError: If generation fails
+        """
+        messages = build_config_generation_messages(
+            requirements=requirements,
+            catalog_name=catalog_name,
+            warehouse_id=warehouse_id,
+            table_metadata=table_metadata,
+            cache_prefix=self.prompt_caching,
+        )
+
+        # Serialized once and spliced into the request body on every attempt
+        messages_json = dumps_bytes(messages)
+
+        cache_key = _response_cache_key(messages_json, temperature)
+        cached = self._cached_response(cache_key, refresh)
+        if cached is not None:
+            return cached
+
+        if cache_key is None:
+            return await self._agenerate(messages_json, warehouse_id, temperature, cache_key)
+
+        task = self.ainflight.get(cache_key)
+        if task is not None:
+            return (await asyncio.shield(task)).model_copy(deep=True)
+
+        task = asyncio.ensure_future(
+            self._agenerate(messages_json, warehouse_id, temperature, cache_key)
+        )
+        self.ainflight[cache_key] = task
+        task.add_done_callback(lambda _: self.ainflight.pop(cache_key, None))
+        # Shielded so a cancelled caller does not cancel the shared call
+        return await asyncio.shield(task)
+
+    async def _agenerate(
+        self,
+        messages_json: bytes,
+        warehouse_id: str,
+        temperature: float,
+        cache_key: Optional[str],
+    ) -> LLMResponse:
+        """Async variant of _generate."""
+        for attempt in range(self.max_retries):
+            try:
+                response = await self._acall_llm(messages_json, temperature)
+                llm_response = await asyncio.to_thread(self._parse_response, response, warehouse_id)
+                self._cache_response(cache_key, llm_response)
                 return llm_response
             except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise LLMError(f"Failed to generate config after {self.max_retries} attempts: {str(e)}")
-                # Retry with slightly higher temperature
-                temperature = min(1.0, temperature + 0.1)
+                retry, bump_temperature = _classify_failure(e)
+                if not retry or attempt == self.max_retries - 1:
+                    raise LLMError(
+                        f"Failed to generate config after {attempt + 1} attempts: {str(e)}"
+                    )
+                # Only malformed output benefits from a different sample
+                if bump_temperature:
+                    temperature = min(1.0, temperature + 0.1)
+                await asyncio.sleep(_retry_delay(attempt))
 
         raise LLMError("Unexpected error in config generation")
 
-    def _call_llm(self, prompt: str, temperature: float = 0.7) -> str:
+    def _cached_response(self, cache_key: Optional[str], refresh: bool) -> Optional[LLMResponse]:
+        """Return a copy of the cached response for cache_key, if any."""
+        if cache_key is None or refresh:
+            return None
+        cached = self.response_cache.get(cache_key)
+        return cached.model_copy(deep=True) if cached is not None else None
+
+    def _cache_response(self, cache_key: Optional[str], llm_response: LLMResponse) -> None:
+        """Store a copy of a parsed response so later callers cannot mutate it."""
+        if cache_key is not None:
+            self.response_cache[cache_key] = llm_response.model_copy(deep=True)
+
+    def _call_llm(self, messages_json: bytes, temperature: float = 0.7) -> str:
         """Call the Databricks serving endpoint.
 
+        The completion is streamed and the connection is closed as soon as the
+        config object (see _PAYLOAD_START_RE) is complete, skipping any
+        trailing prose.
+        Endpoints that ignore the stream flag are read as a single response.
+
         Args:
-            prompt: Prompt to send to LLM
+            messages_json: Chat messages to send to LLM, serialized as JSON
             temperature: Sampling temperature
 
         Returns:
@@ -92,50 +313,106 @@ class GenieConfigGenerator:
         """
         try:
             # Get the serving endpoint
-            endpoint = self.client.serving_endpoints.get(name=self.serving_endpoint_name)
-
-            # Build request
-            request_data = {
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                "temperature": temperature,
-                "max_tokens": 4000,
-            }
+            self._get_endpoint()
 
             # Make request using httpx (Databricks SDK doesn't have direct serving endpoint query)
-            host = self.client.config.host
-            token = self.client.config.token
+            url, content, headers = self._build_request(messages_json, temperature)
+            with self.http.stream("POST", url, content=content, headers=headers) as response:
+                response.raise_for_status()
 
-            if not token:
-                raise LLMError("No authentication token available for serving endpoint")
+                if not _is_event_stream(response):
+                    response.read()
+                    return self._extract_content(response)
 
-            url = f"{host}/serving-endpoints/{self.serving_endpoint_name}/invocations"
+                collector = _StreamCollector()
+                for line in response.iter_lines():
+                    if collector.feed_line(line):
+                        break
+                _log_usage(collector.usage)
+                return collector.text()
+
+        except httpx.HTTPError as e:
+            raise LLMError(f"HTTP error calling serving endpoint: {str(e)}") from e
+        except Exception as e:
+            raise LLMError(f"Error calling LLM: {str(e)}") from e
+
+    async def _acall_llm(self, messages_json: bytes, temperature: float = 0.7) -> str:
+        """Async variant of _call_llm using the pooled async HTTP client."""
+        try:
+            # Get the serving endpoint
+            if self.endpoint is None:
+                await asyncio.to_thread(self._get_endpoint)
 
-            with httpx.Client() as http_client:
-                response = http_client.post(
-                    url,
-                    json=request_data,
-                    headers={"Authorization": f"Bearer {token}"},
-                    timeout=120.0,
-                )
+            url, content, headers = self._build_request(messages_json, temperature)
+            async with self.ahttp.stream("POST", url, content=content, headers=headers) as response:
                 response.raise_for_status()
 
-            result = response.json()
+                if not _is_event_stream(response):
+                    await response.aread()
+                    return self._extract_content(response)
 
-            # Extract response text
-            if "choices" in result and len(result["choices"]) > 0:
-                return result["choices"][0]["message"]["content"]
-            else:
-                raise LLMError(f"Unexpected response format: {result}")
+                collector = _StreamCollector()
+                async for line in response.aiter_lines():
+                    if collector.feed_line(line):
+                        break
+                _log_usage(collector.usage)
+                return collector.text()
 
         except httpx.HTTPError as e:
-            raise LLMError(f"HTTP error calling serving endpoint: {str(e)}")
+            raise LLMError(f"HTTP error calling serving endpoint: {str(e)}") from e
         except Exception as e:
-            raise LLMError(f"Error calling LLM: {str(e)}")
+            raise LLMError(f"Error calling LLM: {str(e)}") from e
+
+    def _get_endpoint(self) -> "ServingEndpointDetailed":
+        """Look up the serving endpoint once and reuse it for later calls."""
+        if self.endpoint is None:
+            self.endpoint = self.client.serving_endpoints.get(name=self.serving_endpoint_name)
+        return self.endpoint
+
+    def _build_request(
+        self, messages_json: bytes, temperature: float
+    ) -> tuple[str, bytes, dict[str, str]]:
+        """Build the invocation URL, JSON body, and headers for a chat completion.
+
+        The body is spliced from pre-serialized pieces, since only the
+        temperature changes between attempts.
+
+        Raises:
+            LLMError: If no authentication token is available
+        """
+        content = b"".join(
+            (
+                _REQUEST_BODY_PREFIX,
+                messages_json,
+                _REQUEST_BODY_TEMPERATURE,
+                dumps_bytes(temperature),
+                _REQUEST_BODY_SUFFIX,
+            )
+        )
+
+        token = self.client.config.token
+
+        if not token:
+            raise LLMError("No authentication token available for serving endpoint")
+
+        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+
+        return self.invocation_url, content, headers
+
+    @staticmethod
+    def _extract_content(response: httpx.Response) -> str:
+        """Extract the completion text from a serving endpoint response.
+
+        Raises:
+            LLMError: If the response has no choices
+        """
+        result = loads(response.content)
+        _log_usage(result.get("usage"))
+
+        if "choices" in result and len(result["choices"]) > 0:
+            return result["choices"][0]["message"]["content"]
+        else:
+            raise LLMError(f"Unexpected response format: {result}")
 
     def _parse_response(self, response: str, warehouse_id: str) -> LLMResponse:
         """Parse LLM response into structured format.
@@ -152,26 +429,221 @@ class GenieConfigGenerator:
         """
         try:
             # Extract JSON from response (handle markdown code blocks)
-            json_match = re.search(r"```(?:json)?\s*\n(.*?)\n```", response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # Try to find JSON directly
-                json_str = response
+            json_str = _extract_json(response)
 
-            # Parse JSON
-            data = json.loads(json_str)
+            # Parse and validate in a single pass
+            llm_response = _LLM_RESPONSE_ADAPTER.validate_json(json_str)
 
             # Inject warehouse_id if missing
-            if "genie_space_config" in data:
-                if not data["genie_space_config"].get("warehouse_id"):
-                    data["genie_space_config"]["warehouse_id"] = warehouse_id
+            if not llm_response.genie_space_config.warehouse_id:
+                llm_response.genie_space_config.warehouse_id = warehouse_id
 
-            # Validate with Pydantic
-            llm_response = LLMResponse(**data)
             return llm_response
 
-        except json.JSONDecodeError as e:
-            raise LLMError(f"Failed to parse JSON response: {str(e)}\nResponse: {response[:500]}")
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise LLMError(
+                    f"Failed to parse JSON response: {str(e)}\nResponse: {response[:500]}"
+                ) from e
+            raise LLMError(f"Failed to parse LLM response: {str(e)}") from e
         except Exception as e:
             raise LLMError(f"Failed to parse LLM response: {str(e)}")
+
+
+def _extract_json(response: str) -> str:
+    """Extract the JSON payload from an LLM response.
+
+    Returns the body of the first fenced code block if there is one, otherwise
+    the first balanced top-level JSON object, otherwise the response unchanged.
+    """
+    fence = response.find("```")
+    if fence != -1:
+        body_start = response.find("\n", fence + 3)
+        if body_start != -1:
+            body_end = response.find("\n```", body_start)
+            if body_end != -1:
+                return response[body_start + 1 : body_end]
+
+    start = _payload_start(response)
+    if start is None:
+        start = response.find("{")
+        if start == -1:
+            return response
+
+    end = _JsonObjectScanner().feed(response[start:])
+    return response[start : start + end] if end is not None else response
+
+
+class _JsonObjectScanner:
+    """Incrementally find the end of the first top-level JSON object in a text stream.
+
+    Text before the first ``{`` is skipped, and braces inside string literals
+    are ignored.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> Optional[int]:
+        """Consume a chunk of text.
+
+        Returns:
+            Offset just past the closing brace within this chunk once the
+            object is complete, otherwise None
+        """
+        for index, char in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == "{":
+                self.depth += 1
+            elif self.depth == 0:
+                continue
+            elif char == '"':
+                self.in_string = True
+            elif char == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    return index + 1
+        return None
+
+
+class _StreamCollector:
+    """Accumulate chat completion deltas from server-sent event lines.
+
+    Braces are only tracked from the start of the config payload, so prose
+    such as "using {catalog} placeholders" ahead of it does not end the
+    stream early. With debug logging enabled the stream is read to the end,
+    since endpoints report token usage on the final chunk.
+    """
+
+    __slots__ = ("parts", "scanner", "pending", "usage", "complete", "drain")
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+        self.scanner: Optional[_JsonObjectScanner] = None
+        # Text received before the payload start was found
+        self.pending = ""
+        # Token usage from the latest chunk that reported it
+        self.usage: Optional[dict[str, Any]] = None
+        self.complete = False
+        self.drain = logger.isEnabledFor(logging.DEBUG)
+
+    def feed_line(self, line: str) -> bool:
+        """Consume one SSE line; return True once the JSON payload is complete."""
+        if not line.startswith("data:"):
+            return False
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return True
+
+        chunk = loads(data)
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+        if self.complete:
+            return False
+        choices = chunk.get("choices")
+        if not choices:
+            return False
+        delta = (choices[0].get("delta") or {}).get("content")
+        if not delta:
+            return False
+
+        self.parts.append(delta)
+        if self.scanner is None:
+            # The start marker may be split across deltas, so search the
+            # text received so far
+            self.pending += delta
+            start = _payload_start(self.pending)
+            if start is None:
+                return False
+            self.scanner = _JsonObjectScanner()
+            delta = self.pending[start:]
+            self.pending = ""
+        self.complete = self.scanner.feed(delta) is not None
+        return self.complete and not self.drain
+
+    def text(self) -> str:
+        """Return the completion text received so far.
+
+        Raises:
+            LLMError: If the stream carried no content
+        """
+        if not self.parts:
+            raise LLMError("Streaming response contained no content")
+        return "".join(self.parts)
+
+
+def _payload_start(text: str) -> Optional[int]:
+    """Return the offset of the brace opening the config payload, if present."""
+    match = _PAYLOAD_START_RE.search(text)
+    if match is None:
+        return None
+    return match.start(1) if match.group(1) is not None else match.start(2)
+
+
+def _log_usage(usage: Optional[dict[str, Any]]) -> None:
+    """Log prompt and cache-read token counts reported by the endpoint."""
+    if usage and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "LLM usage: prompt_tokens=%s cache_read_input_tokens=%s",
+            usage.get("prompt_tokens"),
+            usage.get("cache_read_input_tokens"),
+        )
+
+
+def _is_event_stream(response: httpx.Response) -> bool:
+    """Return True if the response is a server-sent event stream."""
+    return response.headers.get("content-type", "").startswith("text/event-stream")
+
+
+def _classify_failure(error: Exception) -> tuple[bool, bool]:
+    """Decide whether a failed generation attempt is worth retrying.
+
+    Server errors, rate limits, timeouts, undecodable response bodies or
+    stream chunks, and malformed JSON are retried; other client errors,
+    missing credentials and schema violations are not.
+
+    Returns:
+        (retry, bump_temperature) - the temperature is only raised for
+        malformed JSON, where a different sample may help
+    """
+    cause = error.__cause__ or error
+    if isinstance(cause, httpx.HTTPStatusError):
+        status = cause.response.status_code
+        return status >= 500 or status == 429, False
+    if isinstance(cause, httpx.TransportError):
+        return True, False
+    # A truncated or garbled response body or SSE chunk, not a bad completion
+    if isinstance(cause, JSONDecodeError):
+        return True, False
+    if isinstance(cause, ValidationError):
+        malformed = any(err["type"] == "json_invalid" for err in cause.errors())
+        return malformed, malformed
+    return False, False
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, capped at 30 seconds."""
+    return min(30.0, 2**attempt + random.random())
+
+
+def _response_cache_key(messages_json: bytes, temperature: float) -> Optional[str]:
+    """Return the response cache key for a prompt, or None if it should not be cached.
+
+    Only near-deterministic temperatures are cached; at higher temperatures
+    callers expect a different answer each time.
+    """
+    if temperature > CACHEABLE_TEMPERATURE:
+        return None
+    digest = hashlib.sha256(messages_json)
+    digest.update(f"|{temperature:.2f}".encode())
+    return digest.hexdigest()
@@ -1,6 +1,28 @@
 """Domain-specific configuration templates for Genie spaces."""
 
-from typing import Literal
+import re
+import sys
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Literal
+
+from genie_mcp_server.utils.json_utils import dumps
+
+# Placeholders used in template text
+CATALOG_PLACEHOLDER = sys.intern("[CATALOG]")
+SCHEMA_PLACEHOLDER = sys.intern("[SCHEMA]")
+TABLE_NAME_PLACEHOLDER = sys.intern("[TABLE_NAME]")
+TABLE_PLACEHOLDER = sys.intern("[TABLE]")
+
+_PLACEHOLDER_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (CATALOG_PLACEHOLDER, SCHEMA_PLACEHOLDER, TABLE_NAME_PLACEHOLDER, TABLE_PLACEHOLDER),
+        )
+    )
+)
 
 # Domain-specific templates with placeholders for customization
 TEMPLATES = {
@@ -262,6 +284,33 @@ TEMPLATES = {
 }
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples.
+
+    Strings are interned so text repeated across templates is stored once.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(key): _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert a frozen template back into plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Templates are shared module state, so keep them immutable
+TEMPLATES = _freeze(TEMPLATES)
+
+
 def get_template(
     domain: Literal["minimal", "sales", "customer", "inventory", "financial", "hr"] = "minimal",
 ) -> dict:
@@ -271,8 +320,9 @@ def get_template(
         domain: Type of analytics space (minimal/sales/customer/inventory/financial/hr)
 
     Returns:
-        Template configuration with domain-appropriate metadata, instructions,
-        and example queries. Contains placeholders:
+        A fresh, mutable copy of the template configuration with
+        domain-appropriate metadata, instructions, and example queries.
+        Contains placeholders:
         - [CATALOG]: Replace with your Unity Catalog name
         - [SCHEMA]: Replace with your schema name
         - [TABLE_NAME]: Replace with your table name
@@ -284,4 +334,81 @@ def get_template(
         4. Validate with validate_space_config() tool
         5. Create space with create_genie_space() tool
     """
+    return _thaw(get_template_view(domain))
+
+
+def fill_template(
+    domain: Literal["minimal", "sales", "customer", "inventory", "financial", "hr"],
+    *,
+    catalog: str,
+    schema: str,
+    table: str,
+) -> dict:
+    """Get a mutable copy of a template with its placeholders filled in.
+
+    Each string is scanned once by a single regex rather than once per
+    placeholder, and the copy is built in the same pass.
+
+    Args:
+        domain: Type of analytics space (minimal/sales/customer/inventory/financial/hr)
+        catalog: Value for [CATALOG]
+        schema: Value for [SCHEMA]
+        table: Value for [TABLE_NAME]; [TABLE] becomes catalog.schema.table
+
+    Returns:
+        Template configuration with every placeholder replaced
+    """
+    replacements = {
+        CATALOG_PLACEHOLDER: catalog,
+        SCHEMA_PLACEHOLDER: schema,
+        TABLE_NAME_PLACEHOLDER: table,
+        TABLE_PLACEHOLDER: f"{catalog}.{schema}.{table}",
+    }
+
+    def replace(match: re.Match) -> str:
+        return replacements[match.group()]
+
+    def fill(value: Any) -> Any:
+        if isinstance(value, str):
+            return _PLACEHOLDER_RE.sub(replace, value)
+        if isinstance(value, Mapping):
+            return {key: fill(item) for key, item in value.items()}
+        if isinstance(value, tuple):
+            return [fill(item) for item in value]
+        return value
+
+    return fill(get_template_view(domain))
+
+
+def get_template_view(
+    domain: Literal["minimal", "sales", "customer", "inventory", "financial", "hr"] = "minimal",
+) -> Mapping[str, Any]:
+    """Get a read-only view of the configuration template for a domain.
+
+    Unlike get_template(), no copy is made: nested dicts are read-only mappings
+    and lists are tuples. Use get_template() when the result will be modified.
+
+    Args:
+        domain: Type of analytics space (minimal/sales/customer/inventory/financial/hr)
+
+    Returns:
+        Read-only template configuration
+    """
     return TEMPLATES.get(domain, TEMPLATES["minimal"])
+
+
+@cache
+def get_template_json(
+    domain: Literal["minimal", "sales", "customer", "inventory", "financial", "hr"] = "minimal",
+) -> str:
+    """Get the configuration template for a domain as indented JSON.
+
+    Templates are static, so each domain is serialized once and reused.
+
+    Args:
+        domain: Type of analytics space (minimal/sales/customer/inventory/financial/hr)
+
+    Returns:
+        JSON string with template configuration
+    """
+    return dumps(get_template(domain), indent=True)
@@ -1,31 +1,111 @@
 """Configuration validation for Genie space configurations."""
 
-import json
 import re
-import sqlparse
-from typing import Any
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Optional, Union
+
+from pydantic import TypeAdapter, ValidationError
+
+from genie_mcp_server.models.space import (
+    GenieSpaceConfig,
+    ValidationReport,
+    parse_space_config,
+)
+
+_CONFIG_ADAPTER: TypeAdapter[GenieSpaceConfig] = TypeAdapter(GenieSpaceConfig)
+
+# Wording that makes an instruction too vague for Genie to act on
+_VAGUE_TERMS = ("appropriate", "relevant", "good", "properly", "as needed")
+_VAGUE_TERMS_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, _VAGUE_TERMS)) + r")\b", re.IGNORECASE
+)
+
+# Instructions with fewer words than this are flagged as too short
+_MIN_INSTRUCTION_WORDS = 10
+
+# Smallest batch of SQL strings worth checking on a thread pool
+_PARALLEL_SQL_MIN_BATCH = 32
+
+
+@lru_cache(maxsize=2048)
+def _sql_syntax_error(sql: str) -> Optional[str]:
+    """Return why a SQL string is invalid, or None if it passes.
+
+    Results are cached, so snippets repeated within and across validations
+    are checked once. sqlparse is imported on first use, so validating with
+    validate_sql=False never loads it.
+    """
+    if not sql or not sql.strip():
+        return "Empty SQL query"
+
+    # Cheap character checks run before the much slower sqlparse pass
+    # Check for balanced parentheses
+    if sql.count("(") != sql.count(")"):
+        return "Unbalanced parentheses"
+
+    # Check for balanced quotes; escapes are rare, so skip counting them
+    # unless the string contains a backslash at all
+    single_quotes = sql.count("'")
+    if "\\" in sql:
+        single_quotes -= sql.count("\\'")
+    if single_quotes % 2 != 0:
+        return "Unbalanced single quotes"
+
+    # Parse with sqlparse
+    import sqlparse
+
+    try:
+        parsed = sqlparse.parse(sql)
+    except Exception as e:
+        return str(e)
+    if not parsed:
+        return "Failed to parse SQL query"
+
+    return None
+
+
+def _sql_syntax_errors(sqls: list[str]) -> list[Optional[str]]:
+    """Check many SQL strings, returning _sql_syntax_error() for each.
+
+    sqlparse is pure Python, so threads only help when the interpreter runs
+    without the GIL (free-threaded CPython 3.13+). Large batches are spread
+    over a thread pool there; otherwise they are checked in order.
+    """
+    if len(sqls) >= _PARALLEL_SQL_MIN_BATCH and not _gil_enabled():
+        with ThreadPoolExecutor() as pool:
+            return list(pool.map(_sql_syntax_error, sqls))
+    return [_sql_syntax_error(sql) for sql in sqls]
 
-from genie_mcp_server.models.space import GenieSpaceConfig, GenieSpaceTable, ValidationReport
+
+def _gil_enabled() -> bool:
+    """Return whether the running interpreter has the GIL enabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
 
 
 class ConfigValidator:
     """Validates Genie space configurations for quality and correctness."""
 
-    SQL_KEYWORDS = {
-        "SELECT",
-        "FROM",
-        "WHERE",
-        "JOIN",
-        "GROUP",
-        "BY",
-        "ORDER",
-        "LIMIT",
-        "COUNT",
-        "SUM",
-        "AVG",
-        "MIN",
-        "MAX",
-    }
+    SQL_KEYWORDS = frozenset(
+        {
+            "SELECT",
+            "FROM",
+            "WHERE",
+            "JOIN",
+            "GROUP",
+            "BY",
+            "ORDER",
+            "LIMIT",
+            "COUNT",
+            "SUM",
+            "AVG",
+            "MIN",
+            "MAX",
+        }
+    )
 
     def __init__(self):
         """Initialize the validator."""
@@ -43,16 +123,31 @@ class ConfigValidator:
         Returns:
             ValidationReport with validation results
         """
-        errors = []
-        warnings = []
-        score = 100
-
         # 1. Schema validation with Pydantic
         try:
-            config = GenieSpaceConfig(**config_dict)
+            config = _CONFIG_ADAPTER.validate_python(config_dict)
         except Exception as e:
-            errors.append(f"Schema validation failed: {str(e)}")
-            return ValidationReport(valid=False, errors=errors, warnings=warnings, score=0)
+            return ValidationReport(
+                valid=False, errors=[f"Schema validation failed: {str(e)}"], warnings=[], score=0
+            )
+
+        return self.validate_model(config, validate_sql)
+
+    def validate_model(
+        self, config: GenieSpaceConfig, validate_sql: bool = True
+    ) -> ValidationReport:
+        """Run the quality checks on an already-validated configuration model.
+
+        Args:
+            config: Configuration that has passed schema validation
+            validate_sql: Whether to perform SQL validation
+
+        Returns:
+            ValidationReport with validation results
+        """
+        errors = []
+        warnings = []
+        score = 100
 
         # 2. Check completeness
         completeness_errors, completeness_warnings, completeness_score = self._check_completeness(
@@ -77,9 +172,7 @@ class ConfigValidator:
         valid = len(errors) == 0
         return ValidationReport(valid=valid, errors=errors, warnings=warnings, score=score)
 
-    def _check_completeness(
-        self, config: GenieSpaceConfig
-    ) -> tuple[list[str], list[str], int]:
+    def _check_completeness(self, config: GenieSpaceConfig) -> tuple[list[str], list[str], int]:
         """Check configuration completeness.
 
         Returns:
@@ -125,39 +218,30 @@ class ConfigValidator:
         warnings = []
         score = 100
 
-        # Validate example SQL queries
-        for i, example in enumerate(config.example_sql_queries):
-            try:
-                self._validate_sql_syntax(example.sql_query)
-            except Exception as e:
-                errors.append(f"Example query #{i+1} has invalid SQL: {str(e)}")
-                score -= 15
-
-        # Validate SQL snippets
+        # Every SQL string with the label template, name and score penalty
+        # used in its error message
+        entries = [
+            ("Example query #{}", number, example.sql_query, 15)
+            for number, example in enumerate(config.example_sql_queries, 1)
+        ]
         if config.sql_snippets:
-            # Validate filters
-            for i, filt in enumerate(config.sql_snippets.filters):
-                try:
-                    self._validate_sql_syntax(filt.sql)
-                except Exception as e:
-                    errors.append(f"Filter #{i+1} has invalid SQL: {str(e)}")
-                    score -= 5
-
-            # Validate expressions
-            for i, expr in enumerate(config.sql_snippets.expressions):
-                try:
-                    self._validate_sql_syntax(expr.sql)
-                except Exception as e:
-                    errors.append(f"Expression '{expr.alias}' has invalid SQL: {str(e)}")
-                    score -= 5
-
-            # Validate measures
-            for i, measure in enumerate(config.sql_snippets.measures):
-                try:
-                    self._validate_sql_syntax(measure.sql)
-                except Exception as e:
-                    errors.append(f"Measure '{measure.alias}' has invalid SQL: {str(e)}")
-                    score -= 5
+            snippets = config.sql_snippets
+            entries.extend(
+                chain(
+                    (
+                        ("Filter #{}", number, filt.sql, 5)
+                        for number, filt in enumerate(snippets.filters, 1)
+                    ),
+                    (("Expression '{}'", expr.alias, expr.sql, 5) for expr in snippets.expressions),
+                    (("Measure '{}'", item.alias, item.sql, 5) for item in snippets.measures),
+                )
+            )
+
+        sql_errors = _sql_syntax_errors([sql for _, _, sql, _ in entries])
+        for (label, name, _, penalty), error in zip(entries, sql_errors):
+            if error is not None:
+                errors.append(f"{label.format(name)} has invalid SQL: {error}")
+                score -= penalty
 
         return errors, warnings, max(0, score)
 
@@ -170,22 +254,9 @@ class ConfigValidator:
         Raises:
             ValueError: If SQL is invalid
         """
-        if not sql or not sql.strip():
-            raise ValueError("Empty SQL query")
-
-        # Parse with sqlparse
-        parsed = sqlparse.parse(sql)
-        if not parsed:
-            raise ValueError("Failed to parse SQL query")
-
-        # Check for balanced parentheses
-        if sql.count("(") != sql.count(")"):
-            raise ValueError("Unbalanced parentheses")
-
-        # Check for balanced quotes
-        single_quotes = sql.count("'") - sql.count("\\'")
-        if single_quotes % 2 != 0:
-            raise ValueError("Unbalanced single quotes")
+        error = _sql_syntax_error(sql)
+        if error is not None:
+            raise ValueError(error)
 
     def _check_instruction_quality(self, config: GenieSpaceConfig) -> tuple[list[str], int]:
         """Check instruction quality.
@@ -199,48 +270,53 @@ class ConfigValidator:
         if not config.instructions:
             return warnings, score
 
-        vague_terms = ["appropriate", "relevant", "good", "properly", "as needed"]
-
-        for i, instruction in enumerate(config.instructions):
-            content_lower = instruction.content.lower()
-
-            # Check for vague terms
-            found_vague = [term for term in vague_terms if term in content_lower]
+        for number, instruction in enumerate(config.instructions, 1):
+            # Check for vague terms in a single case-insensitive regex pass;
+            # only the matches are lowercased, not the whole content
+            matches = {match.lower() for match in _VAGUE_TERMS_RE.findall(instruction.content)}
+            found_vague = [term for term in _VAGUE_TERMS if term in matches]
             if found_vague:
                 warnings.append(
-                    f"Instruction #{i+1} contains vague terms: {', '.join(found_vague)}"
+                    f"Instruction #{number} contains vague terms: {', '.join(found_vague)}"
                 )
                 score -= 5
 
-            # Check length
-            word_count = len(instruction.content.split())
-            if word_count < 10:
-                warnings.append(f"Instruction #{i+1} is very short ({word_count} words)")
+            # Check length; only counts below the threshold matter, so stop
+            # splitting after enough words to exceed it
+            word_count = len(instruction.content.split(maxsplit=_MIN_INSTRUCTION_WORDS))
+            if word_count < _MIN_INSTRUCTION_WORDS:
+                warnings.append(f"Instruction #{number} is very short ({word_count} words)")
                 score -= 3
 
             # Check for specificity (backticked column names)
             if "`" not in instruction.content:
                 warnings.append(
-                    f"Instruction #{i+1} lacks specific column/table references (use backticks)"
+                    f"Instruction #{number} lacks specific column/table references (use backticks)"
                 )
                 score -= 3
 
         return warnings, max(0, score)
 
-    def validate_json_string(self, json_string: str) -> ValidationReport:
+    def validate_json_string(
+        self, json_string: Union[str, bytes], validate_sql: bool = True
+    ) -> ValidationReport:
         """Validate a JSON string as a Genie configuration.
 
+        Parsing and schema validation happen in a single pydantic-core pass,
+        without building an intermediate dict.
+
         Args:
-            json_string: JSON string to validate
+            json_string: JSON string (or UTF-8 bytes) to validate
+            validate_sql: Whether to perform SQL validation
 
         Returns:
             ValidationReport with validation results
         """
         try:
-            config_dict = json.loads(json_string)
-        except json.JSONDecodeError as e:
-            return ValidationReport(
-                valid=False, errors=[f"Invalid JSON: {str(e)}"], warnings=[], score=0
-            )
+            config = parse_space_config(json_string)
+        except ValidationError as e:
+            json_errors = [error["msg"] for error in e.errors() if error["type"] == "json_invalid"]
+            errors = json_errors or [f"Schema validation failed: {str(e)}"]
+            return ValidationReport(valid=False, errors=errors, warnings=[], score=0)
 
-        return self.validate_config(config_dict)
+        return self.validate_model(config, validate_sql)
@@ -5,11 +5,37 @@ JSON format (version 2). This module provides transformation between our user-fr
 GenieSpaceConfig model and the API's expected format.
 """
 
-import json
+import os
+import sys
 import uuid
-from typing import Any
-
-from genie_mcp_server.models.space import GenieSpaceConfig
+from operator import attrgetter
+from typing import Any, Optional, Union
+
+from genie_mcp_server.models.space import (
+    GenieSpaceBenchmark,
+    GenieSpaceConfig,
+    GenieSpaceExampleSQL,
+    GenieSpaceInstruction,
+    GenieSpaceJoinSpec,
+    GenieSpaceSQLExpression,
+    GenieSpaceSQLFilter,
+    GenieSpaceSQLMeasure,
+    GenieSpaceSQLSnippets,
+    GenieSpaceTable,
+)
+from genie_mcp_server.utils.json_utils import dumps, loads
+
+# Sort key for tables in data_sources
+_by_identifier = attrgetter("identifier")
+
+# (section, has_alias, has_instruction) for each kind of SQL snippet, in output order
+_SNIPPET_SECTIONS = (
+    ("measures", True, True),
+    ("expressions", True, True),
+    ("filters", False, False),
+)
+
+_SQLSnippet = Union[GenieSpaceSQLMeasure, GenieSpaceSQLExpression, GenieSpaceSQLFilter]
 
 
 def generate_id() -> str:
@@ -21,6 +47,70 @@ def generate_id() -> str:
     return uuid.uuid4().hex
 
 
+def generate_ids(count: int) -> list[str]:
+    """Generate several unique IDs from a single read of the OS random source.
+
+    Args:
+        count: Number of IDs to generate
+
+    Returns:
+        List of 32-character hexadecimal strings
+    """
+    raw = os.urandom(16 * count).hex()
+    return [raw[i : i + 32] for i in range(0, 32 * count, 32)]
+
+
+def _id_count(config: GenieSpaceConfig) -> int:
+    """Return how many IDs config_to_protobuf needs for a configuration."""
+    count = 2 * len(config.example_sql_queries) + len(config.benchmark_questions)
+    count += len(config.join_specifications)
+    if config.instructions:
+        count += 1
+    if config.sql_snippets:
+        snippets = config.sql_snippets
+        count += len(snippets.measures) + len(snippets.expressions) + len(snippets.filters)
+    return count
+
+
+def _join_spec(spec_id: str, join: GenieSpaceJoinSpec) -> dict[str, Any]:
+    """Convert a join specification to a protobuf join_spec with the given id."""
+    # Use the last part of each table name as its alias
+    left_alias = join.left_table.rpartition(".")[2] or "left_table"
+    right_alias = join.right_table.rpartition(".")[2] or "right_table"
+
+    # Build SQL condition with join type prefix for non-INNER joins
+    join_sql = join.join_condition
+    if join.join_type and join.join_type.upper() != "INNER":
+        join_sql = f"{join.join_type.upper()} JOIN: {join.join_condition}"
+
+    # Build instruction array from description and/or instruction
+    instruction_parts = [part for part in (join.description, join.instruction) if part]
+
+    return {
+        "id": spec_id,
+        "left": {"identifier": join.left_table, "alias": left_alias},
+        "right": {"identifier": join.right_table, "alias": right_alias},
+        "sql": [join_sql],
+        **({"instruction": instruction_parts} if instruction_parts else {}),
+    }
+
+
+def _sql_snippet(
+    snippet_id: str, snippet: _SQLSnippet, has_alias: bool, has_instruction: bool
+) -> dict[str, Any]:
+    """Convert a measure, expression or filter to a protobuf sql_snippets entry."""
+    snippet_obj: dict[str, Any] = {"id": snippet_id}
+    if has_alias:
+        snippet_obj["alias"] = snippet.alias
+    snippet_obj["sql"] = [snippet.sql]  # Convert to array
+    snippet_obj["display_name"] = snippet.display_name
+    if snippet.synonyms:
+        snippet_obj["synonyms"] = snippet.synonyms
+    if has_instruction and snippet.instruction:
+        snippet_obj["instruction"] = [snippet.instruction]
+    return snippet_obj
+
+
 def config_to_protobuf(config: GenieSpaceConfig) -> str:
     """Convert GenieSpaceConfig to Databricks Protobuf JSON format.
 
@@ -40,228 +130,124 @@ def config_to_protobuf(config: GenieSpaceConfig) -> str:
             "sample_questions": [{"id": "...", "question": ["..."]}]
         },
         "instructions": {
-            "text_instructions": [{"id": "...", "content": ["line1\\n"]}],
+            "text_instructions": [{"id": "...", "content": ["line1\\nline2\\n"]}],
             "join_specs": [{"left": {...}, "right": {...}, "sql": ["..."]}],
             "sql_snippets": {"expressions": [...], "measures": [...], "filters": [...]},
             "example_question_sqls": [{"id": "...", "question": ["..."], "sql": ["..."]}]
         }
     }
     """
+    # The Databricks API requires every array to be sorted by id. IDs are
+    # drawn up front and handed out in ascending order, and each array is
+    # filled in a single pass, so every array comes out already sorted
+    next_id = iter(sorted(generate_ids(_id_count(config)))).__next__
+
     protobuf_format: dict[str, Any] = {
         "version": 2,
         "data_sources": {
-            "tables": []
-        }
+            # Convert tables to identifiers, sorted by identifier
+            "tables": [
+                {"identifier": table.identifier}
+                for table in sorted(config.tables, key=_by_identifier)
+            ]
+        },
     }
 
-    # Convert tables to identifiers
-    for table in config.tables:
-        identifier = f"{table.catalog_name}.{table.schema_name}.{table.table_name}"
-        protobuf_format["data_sources"]["tables"].append({
-            "identifier": identifier
-        })
-
     # Convert sample questions (from example_sql_queries and benchmark_questions)
-    sample_questions = []
-
-    # Add example SQL queries as sample questions
-    for example in config.example_sql_queries:
-        sample_questions.append({
-            "id": generate_id(),
-            "question": [example.question]
-        })
-
-    # Add benchmark questions
-    for benchmark in config.benchmark_questions:
-        sample_questions.append({
-            "id": generate_id(),
-            "question": [benchmark.question]
-        })
+    sample_questions = [
+        {"id": next_id(), "question": [example.question]} for example in config.example_sql_queries
+    ]
+    sample_questions.extend(
+        {"id": next_id(), "question": [benchmark.question]}
+        for benchmark in config.benchmark_questions
+    )
 
     if sample_questions:
-        protobuf_format["config"] = {
-            "sample_questions": sample_questions
-        }
-
-    # Build instructions section
-    instructions_section: dict[str, Any] = {}
+        protobuf_format["config"] = {"sample_questions": sample_questions}
 
+    # The instructions section is created on first use, so it is only
+    # present when something goes into it
     # 1. Convert plain text instructions to text_instructions
     if config.instructions:
-        content_lines = []
-
-        # Add business context section
-        content_lines.append("BUSINESS CONTEXT:\n")
-        content_lines.append(f"{config.description}\n")
-        content_lines.append(f"Purpose: {config.purpose}\n")
-        content_lines.append("\n")
-
-        # Add plain text instructions
-        content_lines.append("INSTRUCTIONS:\n")
-        for idx, instruction in enumerate(config.instructions, 1):
-            priority_marker = f" [Priority: {instruction.priority}]" if instruction.priority else ""
-            content_lines.append(f"{idx}. {instruction.content}{priority_marker}\n")
+        # Business context and plain text instructions. The API concatenates
+        # the content array, so the text is sent as a single element
+        content_lines = [
+            "BUSINESS CONTEXT:\n",
+            f"{config.description}\n",
+            f"Purpose: {config.purpose}\n",
+            "\n",
+            "INSTRUCTIONS:\n",
+        ]
+        content_lines.extend(
+            f"{idx}. {instruction.content}"
+            f"{f' [Priority: {instruction.priority}]' if instruction.priority else ''}\n"
+            for idx, instruction in enumerate(config.instructions, 1)
+        )
         content_lines.append("\n")
 
         # Add table information
         if config.tables:
             content_lines.append("DATA SOURCES:\n")
-            for table in config.tables:
-                identifier = f"{table.catalog_name}.{table.schema_name}.{table.table_name}"
-                desc = f" - {table.description}" if table.description else ""
-                content_lines.append(f"- {identifier}{desc}\n")
+            content_lines.extend(
+                f"- {table.identifier}{f' - {table.description}' if table.description else ''}\n"
+                for table in config.tables
+            )
             content_lines.append("\n")
 
-        instructions_section["text_instructions"] = [{
-            "id": generate_id(),
-            "content": content_lines
-        }]
+        protobuf_format.setdefault("instructions", {})["text_instructions"] = [
+            {"id": next_id(), "content": ["".join(content_lines)]}
+        ]
 
     # 2. Convert join_specifications to join_specs
     if config.join_specifications:
-        join_specs = []
-        for join in config.join_specifications:
-            # Parse table names to extract identifier and alias
-            left_parts = join.left_table.split(".")
-            right_parts = join.right_table.split(".")
-
-            # Use last part as alias (table name)
-            left_alias = left_parts[-1] if left_parts else "left_table"
-            right_alias = right_parts[-1] if right_parts else "right_table"
-
-            # Build SQL condition with join type prefix for non-INNER joins
-            join_sql = join.join_condition
-            if join.join_type and join.join_type.upper() != "INNER":
-                join_sql = f"{join.join_type.upper()} JOIN: {join.join_condition}"
-
-            join_spec = {
-                "id": generate_id(),
-                "left": {
-                    "identifier": join.left_table,
-                    "alias": left_alias
-                },
-                "right": {
-                    "identifier": join.right_table,
-                    "alias": right_alias
-                },
-                "sql": [join_sql]
-            }
-
-            # Build instruction array from description and/or instruction
-            instruction_parts = []
-            if join.description:
-                instruction_parts.append(join.description)
-            if join.instruction:
-                instruction_parts.append(join.instruction)
-            if instruction_parts:
-                join_spec["instruction"] = instruction_parts
-
-            join_specs.append(join_spec)
-
-        instructions_section["join_specs"] = join_specs
+        protobuf_format.setdefault("instructions", {})["join_specs"] = [
+            _join_spec(next_id(), join) for join in config.join_specifications
+        ]
 
     # 3. Convert sql_snippets to sql_snippets (with proper structure)
     if config.sql_snippets:
         sql_snippets_section: dict[str, list] = {}
 
-        # Convert measures
-        if config.sql_snippets.measures:
-            measures = []
-            for measure in config.sql_snippets.measures:
-                measure_obj = {
-                    "id": generate_id(),
-                    "alias": measure.alias,
-                    "sql": [measure.sql],  # Convert to array
-                    "display_name": measure.display_name
-                }
-                if measure.synonyms:
-                    measure_obj["synonyms"] = measure.synonyms
-                if measure.instruction:
-                    measure_obj["instruction"] = [measure.instruction]
-                measures.append(measure_obj)
-            sql_snippets_section["measures"] = measures
-
-        # Convert expressions
-        if config.sql_snippets.expressions:
-            expressions = []
-            for expr in config.sql_snippets.expressions:
-                expr_obj = {
-                    "id": generate_id(),
-                    "alias": expr.alias,
-                    "sql": [expr.sql],  # Convert to array
-                    "display_name": expr.display_name
-                }
-                if expr.synonyms:
-                    expr_obj["synonyms"] = expr.synonyms
-                if expr.instruction:
-                    expr_obj["instruction"] = [expr.instruction]
-                expressions.append(expr_obj)
-            sql_snippets_section["expressions"] = expressions
-
-        # Convert filters
-        if config.sql_snippets.filters:
-            filters = []
-            for filter_item in config.sql_snippets.filters:
-                filter_obj = {
-                    "id": generate_id(),
-                    "sql": [filter_item.sql],  # Convert to array
-                    "display_name": filter_item.display_name
-                }
-                if filter_item.synonyms:
-                    filter_obj["synonyms"] = filter_item.synonyms
-                filters.append(filter_obj)
-            sql_snippets_section["filters"] = filters
+        for section, has_alias, has_instruction in _SNIPPET_SECTIONS:
+            snippets = getattr(config.sql_snippets, section)
+            if snippets:
+                sql_snippets_section[section] = [
+                    _sql_snippet(next_id(), snippet, has_alias, has_instruction)
+                    for snippet in snippets
+                ]
 
         if sql_snippets_section:
-            instructions_section["sql_snippets"] = sql_snippets_section
+            protobuf_format.setdefault("instructions", {})["sql_snippets"] = sql_snippets_section
 
     # 4. Convert example_sql_queries to example_question_sqls
+    # Note: description is not a valid protobuf field for example_question_sqls
     if config.example_sql_queries:
-        example_question_sqls = []
-        for example in config.example_sql_queries:
-            example_obj = {
-                "id": generate_id(),
+        protobuf_format.setdefault("instructions", {})["example_question_sqls"] = [
+            {
+                "id": next_id(),
                 "question": [example.question],
-                "sql": [example.sql_query]  # Convert to array
+                "sql": [example.sql_query],  # Convert to array
             }
-            # Note: description is not a valid protobuf field for example_question_sqls
-            example_question_sqls.append(example_obj)
-
-        instructions_section["example_question_sqls"] = example_question_sqls
-
-    # Add instructions section if not empty
-    if instructions_section:
-        protobuf_format["instructions"] = instructions_section
+            for example in config.example_sql_queries
+        ]
 
-    # Sort all arrays by 'id' field (Databricks API requires sorted entries)
-    # Sort tables by identifier
-    if "data_sources" in protobuf_format and "tables" in protobuf_format["data_sources"]:
-        protobuf_format["data_sources"]["tables"].sort(key=lambda t: t.get("identifier", ""))
+    return dumps(protobuf_format)
 
-    # Sort sample_questions by id
-    if "config" in protobuf_format and "sample_questions" in protobuf_format.get("config", {}):
-        protobuf_format["config"]["sample_questions"].sort(key=lambda q: q.get("id", ""))
 
-    # Sort instructions sub-sections by id
-    instr = protobuf_format.get("instructions", {})
-    for key in ["text_instructions", "join_specs", "example_question_sqls"]:
-        if key in instr:
-            instr[key].sort(key=lambda item: item.get("id", ""))
+def _join_instruction(instruction: Union[str, list[str], None]) -> Optional[str]:
+    """Collapse a protobuf instruction array (or a bare string) into a single string."""
+    if not instruction:
+        return None
+    if isinstance(instruction, str):
+        return instruction
+    return " ".join(instruction)
 
-    # Sort sql_snippets sub-sections by id
-    snippets = instr.get("sql_snippets", {})
-    for key in ["measures", "expressions", "filters"]:
-        if key in snippets:
-            snippets[key].sort(key=lambda item: item.get("id", ""))
 
-    return json.dumps(protobuf_format)
-
-
-def protobuf_to_config(protobuf_json: str) -> GenieSpaceConfig:
+def protobuf_to_config(protobuf_json: Union[str, bytes]) -> GenieSpaceConfig:
     """Convert Databricks Protobuf JSON format to GenieSpaceConfig.
 
     Args:
-        protobuf_json: JSON string in Databricks Protobuf format
+        protobuf_json: JSON string (or UTF-8 bytes) in Databricks Protobuf format
 
     Returns:
         User-friendly Genie space configuration
@@ -271,136 +257,120 @@ def protobuf_to_config(protobuf_json: str) -> GenieSpaceConfig:
         simplified during the round-trip conversion since the formats are not
         perfectly symmetrical.
     """
-    data = json.loads(protobuf_json)
+    data = loads(protobuf_json)
+    instructions_data = data.get("instructions", {})
+
+    # The payload comes from the Genie API in the shape config_to_protobuf
+    # writes, so models are built with model_construct instead of re-running
+    # pydantic validation on every nested field. Names that tend to repeat
+    # across tables and snippets are interned
 
     # Extract tables
-    tables = []
-    for table_ref in data.get("data_sources", {}).get("tables", []):
-        identifier = table_ref.get("identifier", "")
-        parts = identifier.split(".")
-        if len(parts) == 3:
-            tables.append({
-                "catalog_name": parts[0],
-                "schema_name": parts[1],
-                "table_name": parts[2]
-            })
-
-    # Extract sample questions as benchmark questions
-    benchmark_questions = []
-    for sq in data.get("config", {}).get("sample_questions", []):
-        questions = sq.get("question", [])
-        if questions:
-            benchmark_questions.append({
-                "question": questions[0]  # Take first question variant
-            })
+    tables = [
+        GenieSpaceTable.model_construct(
+            catalog_name=sys.intern(catalog), schema_name=sys.intern(schema), table_name=table
+        )
+        for table_ref in data.get("data_sources", {}).get("tables", ())
+        if (identifier := table_ref.get("identifier", "")).count(".") == 2
+        for catalog, schema, table in (identifier.split(".", 2),)
+    ]
+
+    # Extract sample questions as benchmark questions (first question variant)
+    benchmark_questions = [
+        GenieSpaceBenchmark.model_construct(question=questions[0])
+        for sq in data.get("config", {}).get("sample_questions", ())
+        if (questions := sq.get("question"))
+    ]
 
     # Extract text instructions (simplified - just concatenate content)
     instructions = []
-    for ti in data.get("instructions", {}).get("text_instructions", []):
-        content = "".join(ti.get("content", []))
+    for ti in instructions_data.get("text_instructions", ()):
+        parts = ti.get("content")
+        if not parts:
+            continue
+        content = "".join(parts)
         if content:
-            instructions.append({
-                "content": content.strip()
-            })
+            instructions.append(GenieSpaceInstruction.model_construct(content=content.strip()))
 
     # Extract join specifications
     join_specifications = []
-    for join_spec in data.get("instructions", {}).get("join_specs", []):
+    for join_spec in instructions_data.get("join_specs", ()):
         left_identifier = join_spec.get("left", {}).get("identifier", "")
         right_identifier = join_spec.get("right", {}).get("identifier", "")
         sql = join_spec.get("sql", [])
         join_condition = sql[0] if sql else ""
 
         if left_identifier and right_identifier and join_condition:
-            join_obj = {
-                "left_table": left_identifier,
-                "right_table": right_identifier,
-                "join_condition": join_condition,
-                "join_type": join_spec.get("join_type", "INNER")
-            }
-            # instruction is stored as an array in protobuf format
-            instruction_arr = join_spec.get("instruction", [])
-            if isinstance(instruction_arr, str):
-                instruction_arr = [instruction_arr]
-            if instruction_arr:
-                join_obj["instruction"] = " ".join(instruction_arr)
-            join_specifications.append(join_obj)
-
-    # Extract SQL snippets
-    sql_snippets = {}
-    snippets_section = data.get("instructions", {}).get("sql_snippets", {})
-
-    # Extract measures
-    measures = []
-    for measure in snippets_section.get("measures", []):
-        sql = measure.get("sql", [])
-        measure_obj = {
-            "alias": measure.get("alias", ""),
-            "sql": sql[0] if sql else "",
-            "display_name": measure.get("display_name", "")
-        }
-        if measure.get("synonyms"):
-            measure_obj["synonyms"] = measure["synonyms"]
-        if measure.get("instruction"):
-            measure_obj["instruction"] = measure["instruction"]
-        measures.append(measure_obj)
-
-    # Extract expressions
-    expressions = []
-    for expr in snippets_section.get("expressions", []):
-        sql = expr.get("sql", [])
-        expr_obj = {
-            "alias": expr.get("alias", ""),
-            "sql": sql[0] if sql else "",
-            "display_name": expr.get("display_name", "")
-        }
-        if expr.get("synonyms"):
-            expr_obj["synonyms"] = expr["synonyms"]
-        if expr.get("instruction"):
-            expr_obj["instruction"] = expr["instruction"]
-        expressions.append(expr_obj)
-
-    # Extract filters
-    filters = []
-    for filter_item in snippets_section.get("filters", []):
-        sql = filter_item.get("sql", [])
-        filter_obj = {
-            "sql": sql[0] if sql else "",
-            "display_name": filter_item.get("display_name", "")
-        }
-        if filter_item.get("synonyms"):
-            filter_obj["synonyms"] = filter_item["synonyms"]
-        filters.append(filter_obj)
-
-    if measures or expressions or filters:
-        sql_snippets = {
-            "measures": measures,
-            "expressions": expressions,
-            "filters": filters
-        }
+            join_specifications.append(
+                GenieSpaceJoinSpec.model_construct(
+                    left_table=left_identifier,
+                    right_table=right_identifier,
+                    join_condition=join_condition,
+                    join_type=join_spec.get("join_type", "INNER"),
+                    instruction=_join_instruction(join_spec.get("instruction")),
+                )
+            )
+
+    # Extract SQL snippets (most imported spaces have none)
+    sql_snippets = None
+    snippets_section = instructions_data.get("sql_snippets")
+    if snippets_section:
+        measures = [
+            GenieSpaceSQLMeasure.model_construct(
+                alias=sys.intern(measure.get("alias", "")),
+                sql=sql[0] if (sql := measure.get("sql")) else "",
+                display_name=sys.intern(measure.get("display_name", "")),
+                synonyms=measure.get("synonyms") or None,
+                instruction=_join_instruction(measure.get("instruction")),
+            )
+            for measure in snippets_section.get("measures", ())
+        ]
+        expressions = [
+            GenieSpaceSQLExpression.model_construct(
+                alias=sys.intern(expr.get("alias", "")),
+                sql=sql[0] if (sql := expr.get("sql")) else "",
+                display_name=sys.intern(expr.get("display_name", "")),
+                synonyms=expr.get("synonyms") or None,
+                instruction=_join_instruction(expr.get("instruction")),
+            )
+            for expr in snippets_section.get("expressions", ())
+        ]
+        filters = [
+            GenieSpaceSQLFilter.model_construct(
+                sql=sql[0] if (sql := filter_item.get("sql")) else "",
+                display_name=sys.intern(filter_item.get("display_name", "")),
+                synonyms=filter_item.get("synonyms") or None,
+            )
+            for filter_item in snippets_section.get("filters", ())
+        ]
+
+        if measures or expressions or filters:
+            sql_snippets = GenieSpaceSQLSnippets.model_construct(
+                measures=measures, expressions=expressions, filters=filters
+            )
 
     # Extract example SQL queries
     example_sql_queries = []
-    for example in data.get("instructions", {}).get("example_question_sqls", []):
+    for example in instructions_data.get("example_question_sqls", ()):
         question = example.get("question", [])
         sql = example.get("sql", [])
         if question and sql:
-            example_obj = {
-                "question": question[0],
-                "sql_query": sql[0]
-            }
-            if example.get("description"):
-                example_obj["description"] = example["description"]
-            example_sql_queries.append(example_obj)
-
-    return GenieSpaceConfig(
+            example_sql_queries.append(
+                GenieSpaceExampleSQL.model_construct(
+                    question=question[0],
+                    sql_query=sql[0],
+                    description=example.get("description") or None,
+                )
+            )
+
+    return GenieSpaceConfig.model_construct(
         space_name="Imported Space",
         description="Imported from Databricks",
         purpose="Configuration imported from existing Genie space",
         tables=tables,
         instructions=instructions,
         benchmark_questions=benchmark_questions,
-        join_specifications=join_specifications if join_specifications else None,
-        sql_snippets=sql_snippets if sql_snippets else None,
-        example_sql_queries=example_sql_queries if example_sql_queries else None
+        join_specifications=join_specifications,
+        sql_snippets=sql_snippets,
+        example_sql_queries=example_sql_queries,
     )
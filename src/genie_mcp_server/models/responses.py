@@ -2,12 +2,17 @@
 
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Response models are built once and never mutated
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra="forbid")
 
 
 class SpaceResponse(BaseModel):
     """Response from space creation/update operations."""
 
+    model_config = _RESPONSE_CONFIG
+
     space_id: str = Field(..., description="Unique identifier for the space")
     title: Optional[str] = Field(None, description="Space title")
     description: Optional[str] = Field(None, description="Space description")
@@ -20,20 +25,24 @@ class SpaceResponse(BaseModel):
 class MessageResponse(BaseModel):
     """Response from asking a question to Genie."""
 
+    model_config = _RESPONSE_CONFIG
+
     conversation_id: str = Field(..., description="Unique identifier for the conversation")
     message_id: str = Field(..., description="Unique identifier for the message")
-    status: str = Field(..., description="Message status (COMPLETED, EXECUTING_QUERY, FAILED, etc.)")
+    status: str = Field(
+        ..., description="Message status (COMPLETED, EXECUTING_QUERY, FAILED, etc.)"
+    )
     response_text: Optional[str] = Field(None, description="Genie's text response")
     sql_query: Optional[str] = Field(None, description="Generated SQL query")
-    query_result: Optional[dict[str, Any]] = Field(
-        None, description="Query results if available"
-    )
+    query_result: Optional[dict[str, Any]] = Field(None, description="Query results if available")
     error: Optional[str] = Field(None, description="Error message if failed")
 
 
 class ConversationSummary(BaseModel):
     """Summary of a conversation."""
 
+    model_config = _RESPONSE_CONFIG
+
     conversation_id: str = Field(..., description="Unique identifier for the conversation")
     space_id: str = Field(..., description="Space this conversation belongs to")
     title: Optional[str] = Field(None, description="Conversation title")
@@ -42,15 +51,27 @@ class ConversationSummary(BaseModel):
     updated_timestamp: Optional[int] = Field(None, description="Last update timestamp")
 
 
+class ColumnMetadata(BaseModel):
+    """Metadata for a single table column."""
+
+    model_config = _RESPONSE_CONFIG
+
+    name: str = Field(..., description="Column name")
+    type: Optional[str] = Field(None, description="Column data type")
+    comment: Optional[str] = Field(None, description="Column comment/description")
+
+
 class TableMetadata(BaseModel):
     """Metadata for a Unity Catalog table."""
 
+    model_config = _RESPONSE_CONFIG
+
     catalog_name: str = Field(..., description="Catalog name")
     schema_name: str = Field(..., description="Schema name")
     table_name: str = Field(..., description="Table name")
     table_type: Optional[str] = Field(None, description="Table type (MANAGED, EXTERNAL, VIEW)")
     comment: Optional[str] = Field(None, description="Table comment/description")
-    columns: list[dict[str, Any]] = Field(
+    columns: list[ColumnMetadata] = Field(
         default_factory=list, description="Column metadata (name, type, comment)"
     )
     owner: Optional[str] = Field(None, description="Table owner")
@@ -1,8 +1,10 @@
 """Pydantic models for Genie space configuration."""
 
-from typing import Optional
+import sys
+from functools import cached_property
+from typing import Any, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class GenieSpaceTable(BaseModel):
@@ -13,6 +15,29 @@ class GenieSpaceTable(BaseModel):
     table_name: str = Field(..., description="Table name in Unity Catalog")
     description: Optional[str] = Field(None, description="Custom description for the table")
 
+    # Every table in a space usually shares the same catalog and schema
+    @field_validator("catalog_name", "schema_name")
+    @classmethod
+    def _intern_name(cls, value: str) -> str:
+        return sys.intern(value)
+
+    @cached_property
+    def identifier(self) -> str:
+        """Fully qualified table name (catalog.schema.table), computed once."""
+        return f"{self.catalog_name}.{self.schema_name}.{self.table_name}"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.__dict__.pop("identifier", None)
+        super().__setattr__(name, value)
+
+    def model_copy(
+        self, *, update: Optional[dict[str, Any]] = None, deep: bool = False
+    ) -> "GenieSpaceTable":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("identifier", None)
+        return copied
+
 
 class GenieSpaceInstruction(BaseModel):
     """Represents a plain text instruction for the Genie space."""
@@ -168,12 +193,29 @@ class GenieSpaceConfig(BaseModel):
                         "sql_query": "SELECT product_name, COUNT(*) as sales FROM transactions WHERE transaction_date >= CURRENT_DATE - 7 GROUP BY product_name ORDER BY sales DESC LIMIT 10",
                     }
                 ],
-                "benchmark_questions": [{"question": "What were the top 10 selling products last week?"}],
+                "benchmark_questions": [
+                    {"question": "What were the top 10 selling products last week?"}
+                ],
             }
         }
     )
 
 
+def parse_space_config(config_json: Union[str, bytes]) -> GenieSpaceConfig:
+    """Parse and validate GenieSpaceConfig JSON in a single pass.
+
+    Args:
+        config_json: GenieSpaceConfig as a JSON string or UTF-8 bytes
+
+    Returns:
+        Validated GenieSpaceConfig
+
+    Raises:
+        pydantic.ValidationError: If the JSON is invalid or does not match the schema
+    """
+    return GenieSpaceConfig.model_validate_json(config_json)
+
+
 class LLMResponse(BaseModel):
     """Response from the LLM containing the generated Genie space configuration."""
 
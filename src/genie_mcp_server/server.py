@@ -1,24 +1,86 @@
 """Main MCP server for Databricks Genie."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastmcp import FastMCP
 
-from genie_mcp_server.auth import create_workspace_client
+from genie_mcp_server.auth import get_workspace_client
+from genie_mcp_server.client.async_genie_client import AsyncGenieClient
 from genie_mcp_server.client.genie_client import GenieClient
 from genie_mcp_server.config import get_databricks_config
+from genie_mcp_server.generators.schema_exporter import get_json_schema_json
+from genie_mcp_server.generators.templates import get_template_json
+from genie_mcp_server.skills import ask_skill, bulk_skill, create_space_skill, inspect_skill
 from genie_mcp_server.tools import config_gen_tools, conversation_tools, space_tools
+from genie_mcp_server.utils.json_utils import dumps
 
-# Initialize fastmcp server
-mcp = FastMCP("genie-mcp-server")
+# Domains accepted by get_config_template, in display order
+_TEMPLATE_DOMAINS = ("minimal", "sales", "customer", "inventory", "financial", "hr")
+_VALID_DOMAINS = frozenset(_TEMPLATE_DOMAINS)
+_VALID_DOMAINS_STR = ", ".join(_TEMPLATE_DOMAINS)
 
 # Global clients (initialized on startup)
 workspace_client = None
 genie_client = None
 
 
+def init_clients() -> GenieClient:
+    """Create the shared clients and hand them to the tool modules.
+
+    Safe to call more than once; later calls return the existing Genie client.
+    Runs from both main() and the server lifespan, so the server also starts
+    when launched by ``fastmcp run`` or imported.
+
+    Returns:
+        Shared GenieClient instance
+    """
+    global workspace_client, genie_client
+    if genie_client is not None:
+        return genie_client
+
+    # Load configuration
+    config = get_databricks_config()
+
+    # Create the shared authenticated workspace client
+    workspace_client = get_workspace_client()
+
+    # Initialize Genie client
+    genie_client = GenieClient(workspace_client)
+
+    # Set clients in tool modules
+    space_tools.set_genie_client(genie_client)
+    conversation_tools.set_workspace_client(workspace_client, config.query_results_volume_path)
+    config_gen_tools.set_workspace_client(
+        workspace_client, config.serving_endpoint_name, config.serving_prompt_caching
+    )
+    return genie_client
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Open the pooled async HTTP clients for the server's lifetime."""
+    client = init_clients()
+    async_genie_client = AsyncGenieClient(client.client, cache=client.cache)
+    previous = space_tools.set_async_genie_client(async_genie_client)
+    config_generator = config_gen_tools.get_config_generator()
+    try:
+        yield
+    finally:
+        # Restore whatever was installed before, rather than unsetting it
+        space_tools.set_async_genie_client(previous)
+        await async_genie_client.aclose()
+        await config_generator.aclose()
+
+
+# Initialize fastmcp server
+mcp = FastMCP("genie-mcp-server", lifespan=lifespan)
+
+
 @mcp.tool()
-def create_genie_space(
+async def create_genie_space(
     warehouse_id: str,
     config_json: str,
     title: Optional[str] = None,
@@ -62,7 +124,7 @@ def create_genie_space(
             ]
         }
     """
-    return space_tools.create_genie_space(
+    return await space_tools.acreate_genie_space(
         warehouse_id=warehouse_id,
         config_json=config_json,
         title=title,
@@ -72,7 +134,9 @@ def create_genie_space(
 
 
 @mcp.tool()
-def list_genie_spaces(page_size: Optional[int] = None, page_token: Optional[str] = None) -> str:
+async def list_genie_spaces(
+    page_size: Optional[int] = None, page_token: Optional[str] = None
+) -> str:
     """List all Genie spaces in the workspace.
 
     Args:
@@ -82,11 +146,11 @@ def list_genie_spaces(page_size: Optional[int] = None, page_token: Optional[str]
     Returns:
         JSON string with array of space summaries and optional next_page_token
     """
-    return space_tools.list_genie_spaces(page_size=page_size, page_token=page_token)
+    return await space_tools.alist_genie_spaces(page_size=page_size, page_token=page_token)
 
 
 @mcp.tool()
-def get_genie_space(space_id: str, include_config: bool = False) -> str:
+async def get_genie_space(space_id: str, include_config: bool = False) -> str:
     """Get details of a specific Genie space.
 
     Args:
@@ -100,11 +164,11 @@ def get_genie_space(space_id: str, include_config: bool = False) -> str:
         When include_config=True, the serialized_space field contains Databricks Protobuf
         format with data_sources (tables), sample_questions, and text_instructions.
     """
-    return space_tools.get_genie_space(space_id=space_id, include_config=include_config)
+    return await space_tools.aget_genie_space(space_id=space_id, include_config=include_config)
 
 
 @mcp.tool()
-def update_genie_space(
+async def update_genie_space(
     space_id: str,
     config_json: Optional[str] = None,
     title: Optional[str] = None,
@@ -126,7 +190,7 @@ def update_genie_space(
     Note:
         Use the same GenieSpaceConfig format as create_genie_space.
     """
-    return space_tools.update_genie_space(
+    return await space_tools.aupdate_genie_space(
         space_id=space_id,
         config_json=config_json,
         title=title,
@@ -136,7 +200,7 @@ def update_genie_space(
 
 
 @mcp.tool()
-def delete_genie_space(space_id: str) -> str:
+async def delete_genie_space(space_id: str) -> str:
     """Delete a Genie space (soft delete - moves to trash).
 
     Args:
@@ -145,7 +209,7 @@ def delete_genie_space(space_id: str) -> str:
     Returns:
         JSON string with success confirmation
     """
-    return space_tools.delete_genie_space(space_id=space_id)
+    return await space_tools.adelete_genie_space(space_id=space_id)
 
 
 @mcp.tool()
@@ -153,18 +217,23 @@ async def ask_genie(
     space_id: str,
     question: str,
     timeout_seconds: int = 300,
-    poll_interval_seconds: int = 2,
+    poll_interval_seconds: Optional[float] = None,
+    use_cache: bool = True,
 ) -> str:
     """Ask a question to Genie and wait for the response.
 
     This tool applies rate limiting (5 queries per minute) and polls until
-    the query completes or times out.
+    the query completes or times out. Completed answers are cached for 5
+    minutes, so asking the same question again returns the earlier answer
+    without starting a new conversation.
 
     Args:
         space_id: Unique identifier for the Genie space
         question: Natural language question to ask
         timeout_seconds: Maximum time to wait for response (default: 300)
-        poll_interval_seconds: Time between status checks (default: 2)
+        poll_interval_seconds: Fixed time between status checks; by default the
+            wait backs off from 0.3s up to 5s
+        use_cache: Return a recent answer to the same question if there is one (default: True)
 
     Returns:
         JSON string with conversation_id, message_id, status, response_text,
@@ -175,6 +244,7 @@ async def ask_genie(
         question=question,
         timeout_seconds=timeout_seconds,
         poll_interval_seconds=poll_interval_seconds,
+        use_cache=use_cache,
     )
 
 
@@ -184,7 +254,7 @@ async def continue_conversation(
     conversation_id: str,
     question: str,
     timeout_seconds: int = 300,
-    poll_interval_seconds: int = 2,
+    poll_interval_seconds: Optional[float] = None,
 ) -> str:
     """Continue an existing conversation with a follow-up question.
 
@@ -193,7 +263,8 @@ async def continue_conversation(
         conversation_id: ID of the conversation to continue
         question: Follow-up question
         timeout_seconds: Maximum time to wait for response (default: 300)
-        poll_interval_seconds: Time between status checks (default: 2)
+        poll_interval_seconds: Fixed time between status checks; by default the
+            wait backs off from 0.3s up to 5s
 
     Returns:
         JSON string with message details and results
@@ -208,7 +279,7 @@ async def continue_conversation(
 
 
 @mcp.tool()
-def get_query_results(
+async def get_query_results(
     space_id: str, conversation_id: str, message_id: str, attachment_id: Optional[str] = None
 ) -> str:
     """Fetch query result data from a completed message.
@@ -220,9 +291,12 @@ def get_query_results(
         attachment_id: Optional specific attachment ID
 
     Returns:
-        JSON string with query results (up to 5,000 rows)
+        JSON string with query results (up to 5,000 rows). If a results volume
+        is configured and the results are larger than 256 KiB, only the first
+        rows are returned, with a full_results_path for fetch_query_results_file
     """
-    return conversation_tools.get_query_results(
+    return await asyncio.to_thread(
+        conversation_tools.get_query_results,
         space_id=space_id,
         conversation_id=conversation_id,
         message_id=message_id,
@@ -231,7 +305,24 @@ def get_query_results(
 
 
 @mcp.tool()
-def list_conversations(
+async def fetch_query_results_file(path: str, offset: int = 0, limit: int = 500) -> str:
+    """Read a page of rows from query results that get_query_results offloaded to a file.
+
+    Args:
+        path: full_results_path returned by get_query_results
+        offset: Index of the first row to return (default: 0)
+        limit: Maximum number of rows to return (default: 500)
+
+    Returns:
+        JSON string with the schema, the requested rows, and the total row count
+    """
+    return await asyncio.to_thread(
+        conversation_tools.fetch_query_results_file, path=path, offset=offset, limit=limit
+    )
+
+
+@mcp.tool()
+async def list_conversations(
     space_id: str, page_size: int = 50, page_token: Optional[str] = None
 ) -> str:
     """List conversations in a Genie space.
@@ -244,13 +335,16 @@ def list_conversations(
     Returns:
         JSON string with conversation summaries
     """
-    return conversation_tools.list_conversations(
-        space_id=space_id, page_size=page_size, page_token=page_token
+    return await asyncio.to_thread(
+        conversation_tools.list_conversations,
+        space_id=space_id,
+        page_size=page_size,
+        page_token=page_token,
     )
 
 
 @mcp.tool()
-def get_conversation_history(space_id: str, conversation_id: str) -> str:
+async def get_conversation_history(space_id: str, conversation_id: str) -> str:
     """Get all messages in a conversation.
 
     Args:
@@ -260,8 +354,10 @@ def get_conversation_history(space_id: str, conversation_id: str) -> str:
     Returns:
         JSON string with complete conversation thread
     """
-    return conversation_tools.get_conversation_history(
-        space_id=space_id, conversation_id=conversation_id
+    return await asyncio.to_thread(
+        conversation_tools.get_conversation_history,
+        space_id=space_id,
+        conversation_id=conversation_id,
     )
 
 
@@ -290,12 +386,7 @@ def get_config_schema() -> str:
     Returns:
         JSON string with complete schema documentation
     """
-    import json
-
-    from genie_mcp_server.generators.schema_exporter import get_json_schema
-
-    schema = get_json_schema()
-    return json.dumps(schema, indent=2)
+    return get_json_schema_json()
 
 
 @mcp.tool()
@@ -330,31 +421,27 @@ def get_config_template(domain: str = "minimal") -> str:
     Returns:
         JSON string with template configuration
     """
-    import json
-
-    from genie_mcp_server.generators.templates import get_template
-
     # Validate domain parameter
-    valid_domains = ["minimal", "sales", "customer", "inventory", "financial", "hr"]
-    if domain not in valid_domains:
-        return json.dumps(
+    domain = domain.strip().casefold()
+    if domain not in _VALID_DOMAINS:
+        return dumps(
             {
-                "error": f"Invalid domain '{domain}'. Valid options: {', '.join(valid_domains)}",
-                "valid_domains": valid_domains,
+                "error": f"Invalid domain '{domain}'. Valid options: {_VALID_DOMAINS_STR}",
+                "valid_domains": _TEMPLATE_DOMAINS,
             }
         )
 
-    template = get_template(domain)
-    return json.dumps(template, indent=2)
+    return get_template_json(domain)
 
 
 @mcp.tool()
-def generate_space_config(
+async def generate_space_config(
     requirements: str,
     warehouse_id: str,
     catalog_name: str,
     serving_endpoint_name: Optional[str] = None,
     validate_sql: bool = True,
+    schema_name: Optional[str] = None,
 ) -> str:
     """DEPRECATED: Generate a Genie space configuration from natural language requirements.
 
@@ -380,22 +467,25 @@ def generate_space_config(
         catalog_name: Unity Catalog name to use
         serving_endpoint_name: Optional serving endpoint name (uses default if not provided)
         validate_sql: Whether to validate SQL syntax (default: True)
+        schema_name: Schema the space targets; enables the schema reference
+            written by init_schema_reference as table context
 
     Returns:
         JSON string with generated configuration, reasoning, confidence score,
         validation report, and warnings
     """
-    return config_gen_tools.generate_space_config(
+    return await config_gen_tools.agenerate_space_config(
         requirements=requirements,
         warehouse_id=warehouse_id,
         catalog_name=catalog_name,
         serving_endpoint_name=serving_endpoint_name,
         validate_sql=validate_sql,
+        schema_name=schema_name,
     )
 
 
 @mcp.tool()
-def validate_space_config(
+async def validate_space_config(
     config: str, validate_sql: bool = True, catalog_name: Optional[str] = None
 ) -> str:
     """Validate a Genie space configuration.
@@ -414,14 +504,20 @@ def validate_space_config(
     Returns:
         JSON string with validation results including errors, warnings, and quality score
     """
-    return config_gen_tools.validate_space_config(
-        config=config, validate_sql=validate_sql, catalog_name=catalog_name
+    return await asyncio.to_thread(
+        config_gen_tools.validate_space_config,
+        config=config,
+        validate_sql=validate_sql,
+        catalog_name=catalog_name,
     )
 
 
 @mcp.tool()
-def extract_table_metadata(
-    catalog_name: str, schema_name: str, table_names: Optional[list[str]] = None
+async def extract_table_metadata(
+    catalog_name: str,
+    schema_name: str,
+    table_names: Optional[list[str]] = None,
+    warehouse_id: Optional[str] = None,
 ) -> str:
     """Extract metadata for Unity Catalog tables.
 
@@ -432,12 +528,45 @@ def extract_table_metadata(
         catalog_name: Catalog name in Unity Catalog
         schema_name: Schema name in Unity Catalog
         table_names: Optional list of specific table names to include (default: all tables in schema)
+        warehouse_id: Optional SQL warehouse ID to read metadata with one batched query
 
     Returns:
         JSON string with table metadata including columns, types, and descriptions
     """
-    return config_gen_tools.extract_table_metadata(
-        catalog_name=catalog_name, schema_name=schema_name, table_names=table_names
+    return await asyncio.to_thread(
+        config_gen_tools.extract_table_metadata,
+        catalog_name=catalog_name,
+        schema_name=schema_name,
+        table_names=table_names,
+        warehouse_id=warehouse_id,
+    )
+
+
+@mcp.tool()
+async def init_schema_reference(
+    catalog_name: str,
+    schema_name: str,
+    warehouse_id: Optional[str] = None,
+) -> str:
+    """Write a Markdown schema reference for a schema to disk.
+
+    Later config generation reads this file as table context instead of
+    re-discovering the schema. References older than 24 hours are ignored, so
+    re-run this tool to refresh.
+
+    Args:
+        catalog_name: Catalog name in Unity Catalog
+        schema_name: Schema name in Unity Catalog
+        warehouse_id: Optional SQL warehouse ID to read metadata with one batched query
+
+    Returns:
+        JSON string with the written path and table count
+    """
+    return await asyncio.to_thread(
+        config_gen_tools.init_schema_reference,
+        catalog_name=catalog_name,
+        schema_name=schema_name,
+        warehouse_id=warehouse_id,
     )
 
 
@@ -445,16 +574,9 @@ def extract_table_metadata(
 # MCP Prompts (Skills)
 # ============================================================================
 
-from genie_mcp_server.skills import (
-    create_space_skill,
-    ask_skill,
-    inspect_skill,
-    bulk_skill,
-)
-
 
 @mcp.prompt()
-def create_space(
+async def create_space(
     catalog_name: str,
     schema_name: str,
     table_names: str,
@@ -473,7 +595,8 @@ def create_space(
     Example:
         catalog_name="main", schema_name="sales", table_names="orders,customers"
     """
-    result = create_space_skill.run(
+    return await asyncio.to_thread(
+        create_space_skill.run,
         catalog_name=catalog_name,
         schema_name=schema_name,
         table_names=table_names,
@@ -483,11 +606,10 @@ def create_space(
         quick=quick,
         expert=expert,
     )
-    return result
 
 
 @mcp.prompt()
-def ask(
+async def ask(
     question: str,
     space_id: Optional[str] = None,
     space_name: Optional[str] = None,
@@ -503,7 +625,8 @@ def ask(
     Example:
         question="What is total revenue?", space_id="abc123"
     """
-    result = ask_skill.run(
+    return await asyncio.to_thread(
+        ask_skill.run,
         question=question,
         space_id=space_id,
         space_name=space_name,
@@ -512,11 +635,10 @@ def ask(
         timeout=timeout,
         verbose=verbose,
     )
-    return result
 
 
 @mcp.prompt()
-def inspect(
+async def inspect(
     space_id: str,
     mode: str = "health",
     compare_with: Optional[str] = None,
@@ -535,7 +657,8 @@ def inspect(
     Example:
         space_id="abc123", mode="health"
     """
-    result = inspect_skill.run(
+    return await asyncio.to_thread(
+        inspect_skill.run,
         space_id=space_id,
         mode=mode,
         compare_with=compare_with,
@@ -543,11 +666,10 @@ def inspect(
         search_keywords=search_keywords,
         output_file=output_file,
     )
-    return result
 
 
 @mcp.prompt()
-def bulk(
+async def bulk(
     operation: str,
     space_ids: Optional[str] = None,
     pattern: Optional[str] = None,
@@ -565,7 +687,8 @@ def bulk(
     Example:
         operation="update", space_ids="abc,def", add_instructions="Use fiscal year"
     """
-    result = bulk_skill.run(
+    return await asyncio.to_thread(
+        bulk_skill.run,
         operation=operation,
         space_ids=space_ids,
         pattern=pattern,
@@ -573,28 +696,23 @@ def bulk(
         add_tables=add_tables,
         dry_run=dry_run,
     )
-    return result
 
 
-def main():
-    """Main entry point for the MCP server."""
-    global workspace_client, genie_client
+def _use_uvloop() -> None:
+    """Run the server on uvloop when it is installed (the ``uvloop`` extra)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-    # Load configuration
-    config = get_databricks_config()
-
-    # Create authenticated workspace client
-    workspace_client = create_workspace_client(config)
-
-    # Initialize Genie client
-    genie_client = GenieClient(workspace_client)
 
-    # Set clients in tool modules
-    space_tools.set_genie_client(genie_client)
-    conversation_tools.set_workspace_client(workspace_client)
-    config_gen_tools.set_workspace_client(workspace_client, config.serving_endpoint_name)
+def main():
+    """Main entry point for the MCP server."""
+    init_clients()
 
     # Run the MCP server
+    _use_uvloop()
     mcp.run()
 
 
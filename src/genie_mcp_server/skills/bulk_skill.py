@@ -1,12 +1,19 @@
 """Bulk operations skill for batch updates and management."""
 
-import asyncio
 import json
 import re
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
-from genie_mcp_server.tools.space_tools import get_genie_space, list_genie_spaces, delete_genie_space
 from genie_mcp_server.models.protobuf_format import protobuf_to_config
+from genie_mcp_server.tools.space_tools import (
+    delete_genie_space,
+    get_genie_space,
+    list_genie_spaces,
+)
+
+# Spaces fetched, updated or deleted at once by a bulk operation
+MAX_CONCURRENT_REQUESTS = 8
 
 
 def run(
@@ -30,37 +37,64 @@ def run(
     Returns:
         Formatted markdown result.
     """
-    if operation == "update":
-        if not space_ids:
-            return "❌ **Error:** update operation requires space_ids"
+    handler = _OPERATIONS.get(operation.strip().casefold())
+    if handler is None:
+        return f"❌ **Error:** Unknown operation '{operation}'. Use: update, delete, or clone"
+    return handler(
+        space_ids=space_ids,
+        pattern=pattern,
+        add_instructions=add_instructions,
+        add_tables=add_tables,
+        dry_run=dry_run,
+    )
+
+
+def _run_update(
+    space_ids: Optional[str],
+    add_instructions: Optional[str],
+    add_tables: Optional[str],
+    dry_run: bool,
+    **_: Any,
+) -> str:
+    if not space_ids:
+        return "❌ **Error:** update operation requires space_ids"
+    ids = [s.strip() for s in space_ids.split(",") if s.strip()]
+    instructions = (
+        [i.strip() for i in add_instructions.split("\n") if i.strip()] if add_instructions else None
+    )
+    tables = [t.strip() for t in add_tables.split(",") if t.strip()] if add_tables else None
+    return _bulk_update(ids, instructions, tables, dry_run)
+
+
+def _run_delete(space_ids: Optional[str], pattern: Optional[str], dry_run: bool, **_: Any) -> str:
+    if not pattern and not space_ids:
+        return "❌ **Error:** delete operation requires pattern or space_ids"
+    if space_ids:
         ids = [s.strip() for s in space_ids.split(",") if s.strip()]
-        instructions = [i.strip() for i in add_instructions.split("\n") if i.strip()] if add_instructions else None
-        tables = [t.strip() for t in add_tables.split(",") if t.strip()] if add_tables else None
-        return _bulk_update(ids, instructions, tables, dry_run)
-
-    elif operation == "delete":
-        if not pattern and not space_ids:
-            return "❌ **Error:** delete operation requires pattern or space_ids"
-        if space_ids:
-            ids = [s.strip() for s in space_ids.split(",") if s.strip()]
-            return _bulk_delete_by_ids(ids, dry_run)
-        else:
-            return _bulk_delete_by_pattern(pattern, dry_run)
+        return _bulk_delete_by_ids(ids, dry_run)
+    else:
+        return _bulk_delete_by_pattern(pattern, dry_run)
 
-    elif operation == "clone":
-        if not space_ids or "," in space_ids:
-            return "❌ **Error:** clone operation requires exactly one space_id"
-        return "❌ **Error:** Clone operation not yet implemented"
 
-    else:
-        return f"❌ **Error:** Unknown operation '{operation}'. Use: update, delete, or clone"
+def _run_clone(space_ids: Optional[str], **_: Any) -> str:
+    if not space_ids or "," in space_ids:
+        return "❌ **Error:** clone operation requires exactly one space_id"
+    return "❌ **Error:** Clone operation not yet implemented"
+
+
+# Handler for each bulk operation; the operation is matched case-insensitively
+_OPERATIONS = {
+    "update": _run_update,
+    "delete": _run_delete,
+    "clone": _run_clone,
+}
 
 
 def _bulk_update(
     space_ids: list[str],
     add_instructions: Optional[list[str]] = None,
     add_tables: Optional[list[str]] = None,
-    dry_run: bool = True
+    dry_run: bool = True,
 ) -> str:
     """Bulk update multiple spaces.
 
@@ -93,77 +127,14 @@ def _bulk_update(
             output += f"  - {table}\n"
         output += "\n"
 
-    # Process each space
-    results = []
-
-    for space_id in space_ids:
-        try:
-            # Get space config
-            space_json = get_genie_space(space_id, include_serialized_space=True)
-            space = json.loads(space_json)
-            space_name = space.get("title", "Unknown")
-
-            if not space.get("serialized_space"):
-                results.append({
-                    "space_id": space_id,
-                    "name": space_name,
-                    "success": False,
-                    "error": "No configuration found"
-                })
-                continue
-
-            # Parse config
-            config_obj = protobuf_to_config(space["serialized_space"])
-            config = config_obj.model_dump()
-
-            # Apply changes
-            modified = False
-
-            if add_instructions:
-                existing_instructions = config.get("instructions", [])
-                for instr in add_instructions:
-                    existing_instructions.append({"content": instr})
-                config["instructions"] = existing_instructions
-                modified = True
-
-            if add_tables:
-                existing_tables = config.get("tables", [])
-                for table_str in add_tables:
-                    parts = table_str.split(".")
-                    if len(parts) == 3:
-                        existing_tables.append({
-                            "catalog_name": parts[0],
-                            "schema_name": parts[1],
-                            "table_name": parts[2]
-                        })
-                        modified = True
-                config["tables"] = existing_tables
-
-            # Update space (if not dry run)
-            if not dry_run and modified:
-                # Note: update_genie_space expects warehouse_id and config
-                # This is a limitation - we'd need to get the warehouse_id from somewhere
-                results.append({
-                    "space_id": space_id,
-                    "name": space_name,
-                    "success": False,
-                    "error": "Update not implemented (requires warehouse_id)"
-                })
-            else:
-                results.append({
-                    "space_id": space_id,
-                    "name": space_name,
-                    "success": True,
-                    "error": None
-                })
-
-        except Exception as e:
-            results.append({
-                "space_id": space_id,
-                "name": "Unknown",
-                "success": False,
-                "error": str(e)
-            })
+    # Process spaces concurrently; results keep the input order
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        results = list(
+            executor.map(
+                lambda space_id: _update_space(space_id, add_instructions, add_tables, dry_run),
+                space_ids,
+            )
+        )
 
     # Format results
     output += "## Results\n\n"
@@ -187,6 +158,69 @@ def _bulk_update(
     return output
 
 
+def _update_space(
+    space_id: str,
+    add_instructions: Optional[list[str]],
+    add_tables: Optional[list[str]],
+    dry_run: bool,
+) -> dict[str, Any]:
+    """Apply a bulk update to one space and return its result entry."""
+    try:
+        # Get space config
+        space_json = get_genie_space(space_id, include_serialized_space=True)
+        space = json.loads(space_json)
+        space_name = space.get("title", "Unknown")
+
+        if not space.get("serialized_space"):
+            return {
+                "space_id": space_id,
+                "name": space_name,
+                "success": False,
+                "error": "No configuration found",
+            }
+
+        # Parse config
+        config_obj = protobuf_to_config(space["serialized_space"])
+        config = config_obj.model_dump()
+
+        # Apply changes
+        modified = False
+
+        if add_instructions:
+            existing_instructions = config.get("instructions", [])
+            for instr in add_instructions:
+                existing_instructions.append({"content": instr})
+            config["instructions"] = existing_instructions
+            modified = True
+
+        if add_tables:
+            existing_tables = config.get("tables", [])
+            for table_str in add_tables:
+                parts = table_str.split(".")
+                if len(parts) == 3:
+                    existing_tables.append(
+                        {"catalog_name": parts[0], "schema_name": parts[1], "table_name": parts[2]}
+                    )
+                    modified = True
+            config["tables"] = existing_tables
+
+        # Update space (if not dry run)
+        if not dry_run and modified:
+            # Note: update_genie_space expects warehouse_id and config
+            # This is a limitation - we'd need to get the warehouse_id from somewhere
+            return {
+                "space_id": space_id,
+                "name": space_name,
+                "success": False,
+                "error": "Update not implemented (requires warehouse_id)",
+            }
+        else:
+            return {"space_id": space_id, "name": space_name, "success": True, "error": None}
+
+    except Exception as e:
+        return {"space_id": space_id, "name": "Unknown", "success": False, "error": str(e)}
+
+
 def _bulk_delete_by_ids(space_ids: list[str], dry_run: bool = True) -> str:
     """Delete multiple spaces by ID.
 
@@ -204,33 +238,9 @@ def _bulk_delete_by_ids(space_ids: list[str], dry_run: bool = True) -> str:
     else:
         output += "⚠️ **DESTRUCTIVE OPERATION** - Spaces will be permanently deleted\n\n"
 
-    results = []
-
-    for space_id in space_ids:
-        try:
-            # Get space info
-            space_json = get_genie_space(space_id)
-            space = json.loads(space_json)
-            space_name = space.get("title", "Unknown")
-
-            # Delete if not dry run
-            if not dry_run:
-                delete_genie_space(space_id)
-
-            results.append({
-                "space_id": space_id,
-                "name": space_name,
-                "success": True,
-                "error": None
-            })
-
-        except Exception as e:
-            results.append({
-                "space_id": space_id,
-                "name": "Unknown",
-                "success": False,
-                "error": str(e)
-            })
+    # Process spaces concurrently; results keep the input order
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        results = list(executor.map(lambda space_id: _delete_space(space_id, dry_run), space_ids))
 
     # Format results
     output += "## Results\n\n"
@@ -255,6 +265,24 @@ def _bulk_delete_by_ids(space_ids: list[str], dry_run: bool = True) -> str:
     return output
 
 
+def _delete_space(space_id: str, dry_run: bool) -> dict[str, Any]:
+    """Delete one space (unless dry_run) and return its result entry."""
+    try:
+        # Get space info
+        space_json = get_genie_space(space_id)
+        space = json.loads(space_json)
+        space_name = space.get("title", "Unknown")
+
+        # Delete if not dry run
+        if not dry_run:
+            delete_genie_space(space_id)
+
+        return {"space_id": space_id, "name": space_name, "success": True, "error": None}
+
+    except Exception as e:
+        return {"space_id": space_id, "name": "Unknown", "success": False, "error": str(e)}
+
+
 def _bulk_delete_by_pattern(pattern: str, dry_run: bool = True) -> str:
     """Delete spaces matching a pattern.
 
@@ -1,13 +1,17 @@
 """Space inspector skill for analyzing and exporting configurations."""
 
 import json
-from typing import Optional
 from datetime import datetime
+from typing import Any, Optional
 
-from genie_mcp_server.tools.space_tools import get_genie_space, list_genie_spaces, delete_genie_space
-from genie_mcp_server.tools.conversation_tools import list_conversations
 from genie_mcp_server.models.protobuf_format import protobuf_to_config
 from genie_mcp_server.skills.utils.config_analyzer import ConfigAnalyzer
+from genie_mcp_server.tools.conversation_tools import list_conversations
+from genie_mcp_server.tools.space_tools import (
+    get_genie_client,
+    get_genie_space,
+    list_genie_spaces,
+)
 
 
 def run(
@@ -31,20 +35,50 @@ def run(
     Returns:
         Formatted markdown result.
     """
-    if mode == "health":
-        return _health_check(space_id)
-    elif mode == "export":
-        return _export_config(space_id, output_file)
-    elif mode == "diff":
-        if not compare_with:
-            return "❌ **Error:** diff mode requires compare_with parameter"
-        return _diff_configs(space_id, compare_with)
-    elif mode == "find":
-        tables = [t.strip() for t in search_tables.split(",")] if search_tables else None
-        keywords = [k.strip() for k in search_keywords.split(",")] if search_keywords else None
-        return _find_spaces(tables, keywords)
-    else:
+    handler = _MODES.get(mode.strip().casefold())
+    if handler is None:
         return f"❌ **Error:** Unknown mode '{mode}'. Use: health, export, diff, or find"
+    return handler(
+        space_id,
+        compare_with=compare_with,
+        search_tables=search_tables,
+        search_keywords=search_keywords,
+        output_file=output_file,
+    )
+
+
+def _run_health(space_id: str, **_: Any) -> str:
+    return _health_check(space_id)
+
+
+def _run_export(space_id: str, output_file: Optional[str], **_: Any) -> str:
+    return _export_config(space_id, output_file)
+
+
+def _run_diff(space_id: str, compare_with: Optional[str], **_: Any) -> str:
+    if not compare_with:
+        return "❌ **Error:** diff mode requires compare_with parameter"
+    return _diff_configs(space_id, compare_with)
+
+
+def _run_find(
+    space_id: str,
+    search_tables: Optional[str],
+    search_keywords: Optional[str],
+    **_: Any,
+) -> str:
+    tables = [t.strip() for t in search_tables.split(",")] if search_tables else None
+    keywords = [k.strip() for k in search_keywords.split(",")] if search_keywords else None
+    return _find_spaces(tables, keywords)
+
+
+# Handler for each inspect mode; the mode is matched case-insensitively
+_MODES = {
+    "health": _run_health,
+    "export": _run_export,
+    "diff": _run_diff,
+    "find": _run_find,
+}
 
 
 def _health_check(space_id: str) -> str:
@@ -98,7 +132,7 @@ def _health_check(space_id: str) -> str:
             space_name=space_name,
             config=config,
             conversation_count=conversation_count,
-            last_activity=last_activity
+            last_activity=last_activity,
         )
 
     except Exception as e:
@@ -183,7 +217,7 @@ def _diff_configs(space_id_1: str, space_id_2: str) -> str:
         Formatted diff result.
     """
     try:
-        client = GenieClient()
+        client = get_genie_client()
 
         # Get both spaces
         space1 = client.get_space(space_id_1, include_serialized_space=True)
@@ -197,7 +231,7 @@ def _diff_configs(space_id_1: str, space_id_2: str) -> str:
         config2 = protobuf_to_config(space2["serialized_space"]).model_dump()
 
         # Build diff report
-        output = f"# 🔍 Configuration Diff\n\n"
+        output = "# 🔍 Configuration Diff\n\n"
         output += f"**Space 1:** {name1} (`{space_id_1}`)\n"
         output += f"**Space 2:** {name2} (`{space_id_2}`)\n\n"
 
@@ -272,8 +306,7 @@ def _diff_configs(space_id_1: str, space_id_2: str) -> str:
 
 
 def _find_spaces(
-    search_tables: Optional[list[str]] = None,
-    search_keywords: Optional[list[str]] = None
+    search_tables: Optional[list[str]] = None, search_keywords: Optional[list[str]] = None
 ) -> str:
     """Find spaces by table or keyword.
 
@@ -316,28 +349,34 @@ def _find_spaces(
 
                     for search_table in search_tables:
                         if any(search_table.lower() in st.lower() for st in space_tables):
-                            matching_spaces.append({
-                                "space_id": space_id,
-                                "name": space_name,
-                                "match_reason": f"Contains table matching '{search_table}'"
-                            })
+                            matching_spaces.append(
+                                {
+                                    "space_id": space_id,
+                                    "name": space_name,
+                                    "match_reason": f"Contains table matching '{search_table}'",
+                                }
+                            )
                             break
 
                 # Check keywords
                 if search_keywords:
-                    searchable_text = " ".join([
-                        space_name,
-                        config.get("description", ""),
-                        " ".join(i.get("content", "") for i in config.get("instructions", []))
-                    ]).lower()
+                    searchable_text = " ".join(
+                        [
+                            space_name,
+                            config.get("description", ""),
+                            " ".join(i.get("content", "") for i in config.get("instructions", [])),
+                        ]
+                    ).lower()
 
                     for keyword in search_keywords:
                         if keyword.lower() in searchable_text:
-                            matching_spaces.append({
-                                "space_id": space_id,
-                                "name": space_name,
-                                "match_reason": f"Contains keyword '{keyword}'"
-                            })
+                            matching_spaces.append(
+                                {
+                                    "space_id": space_id,
+                                    "name": space_name,
+                                    "match_reason": f"Contains keyword '{keyword}'",
+                                }
+                            )
                             break
 
             except Exception:
@@ -345,7 +384,7 @@ def _find_spaces(
 
         # Format results
         output = "# 🔍 Space Search Results\n\n"
-        output += f"**Search criteria:**\n"
+        output += "**Search criteria:**\n"
         if search_tables:
             output += f"- Tables: {', '.join(search_tables)}\n"
         if search_keywords:
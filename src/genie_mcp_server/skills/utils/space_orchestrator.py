@@ -1,7 +1,6 @@
 """Orchestrate multi-step space creation workflows."""
 
 from typing import Optional
-import json
 
 
 class SpaceOrchestrator:
@@ -30,116 +29,34 @@ class SpaceOrchestrator:
             GenieSpaceConfig dict ready for validation.
         """
         # Import here to avoid circular dependencies
-        from genie_mcp_server.generators.templates import get_template
+        from genie_mcp_server.generators.templates import fill_template
 
-        # Get template
-        template = get_template(domain)
+        # Get template with placeholders filled in
+        config = fill_template(
+            domain,
+            catalog=catalog_name,
+            schema=schema_name,
+            table=table_names[0] if table_names else "table",
+        )
 
         # Generate space name if not provided
         if not space_name:
             space_name = f"{domain.title()} Space - {schema_name}"
 
         # Update basic info
-        config = template.copy()
         config["space_name"] = space_name
         if description:
             config["description"] = description
 
         # Update tables
         config["tables"] = [
-            {
-                "catalog_name": catalog_name,
-                "schema_name": schema_name,
-                "table_name": table_name
-            }
+            {"catalog_name": catalog_name, "schema_name": schema_name, "table_name": table_name}
             for table_name in table_names
         ]
 
-        # Replace placeholders in instructions
-        if "instructions" in config:
-            config["instructions"] = [
-                {
-                    **instruction,
-                    "content": self._replace_placeholders(
-                        instruction["content"],
-                        catalog_name,
-                        schema_name,
-                        table_names[0] if table_names else "table"
-                    )
-                }
-                for instruction in config["instructions"]
-            ]
-
-        # Replace placeholders in example queries
-        if "example_sql_queries" in config:
-            config["example_sql_queries"] = [
-                {
-                    "question": example["question"],
-                    "sql_query": self._replace_placeholders(
-                        example["sql_query"],
-                        catalog_name,
-                        schema_name,
-                        table_names[0] if table_names else "table"
-                    )
-                }
-                for example in config["example_sql_queries"]
-            ]
-
-        # Replace placeholders in SQL snippets
-        if "sql_snippets" in config:
-            for snippet_type in ["measures", "expressions", "filters"]:
-                if snippet_type in config["sql_snippets"]:
-                    config["sql_snippets"][snippet_type] = [
-                        {
-                            **snippet,
-                            "sql": self._replace_placeholders(
-                                snippet["sql"],
-                                catalog_name,
-                                schema_name,
-                                table_names[0] if table_names else "table"
-                            )
-                        }
-                        for snippet in config["sql_snippets"][snippet_type]
-                    ]
-
         return config
 
-    def _replace_placeholders(
-        self,
-        text: str,
-        catalog_name: str,
-        schema_name: str,
-        table_name: str
-    ) -> str:
-        """Replace placeholders in template text.
-
-        Args:
-            text: Text with placeholders.
-            catalog_name: Catalog name to substitute.
-            schema_name: Schema name to substitute.
-            table_name: Table name to substitute.
-
-        Returns:
-            Text with placeholders replaced.
-        """
-        replacements = {
-            "[CATALOG]": catalog_name,
-            "[SCHEMA]": schema_name,
-            "[TABLE_NAME]": table_name,
-            "[TABLE]": f"{catalog_name}.{schema_name}.{table_name}",
-        }
-
-        result = text
-        for placeholder, value in replacements.items():
-            result = result.replace(placeholder, value)
-
-        return result
-
-    def validate_and_score(
-        self,
-        config: dict,
-        validate_sql: bool = True
-    ) -> dict:
+    def validate_and_score(self, config: dict, validate_sql: bool = True) -> dict:
         """Validate config and calculate quality score.
 
         Args:
@@ -180,14 +97,10 @@ class SpaceOrchestrator:
             "score": score,
             "errors": validation.get("errors", []),
             "warnings": validation.get("warnings", []),
-            "recommendations": recommendations
+            "recommendations": recommendations,
         }
 
-    def _calculate_quality_score(
-        self,
-        config: dict,
-        validation: dict
-    ) -> int:
+    def _calculate_quality_score(self, config: dict, validation: dict) -> int:
         """Calculate quality score (0-100) for a config.
 
         Args:
@@ -241,11 +154,7 @@ class SpaceOrchestrator:
 
         return max(0, min(100, score))
 
-    def _generate_recommendations(
-        self,
-        config: dict,
-        validation: dict
-    ) -> list[str]:
+    def _generate_recommendations(self, config: dict, validation: dict) -> list[str]:
         """Generate actionable recommendations for config improvement.
 
         Args:
@@ -262,7 +171,9 @@ class SpaceOrchestrator:
         if table_count == 0:
             recommendations.append("Add at least one table to the space")
         elif table_count > 10:
-            recommendations.append("Consider splitting into multiple spaces (10+ tables can be confusing)")
+            recommendations.append(
+                "Consider splitting into multiple spaces (10+ tables can be confusing)"
+            )
 
         # Instruction recommendations
         instruction_count = len(config.get("instructions", []))
@@ -284,9 +195,13 @@ class SpaceOrchestrator:
         expression_count = len(snippets.get("expressions", []))
 
         if measure_count == 0:
-            recommendations.append("Add SQL measures for common metrics (e.g., revenue, count, average)")
+            recommendations.append(
+                "Add SQL measures for common metrics (e.g., revenue, count, average)"
+            )
         if expression_count == 0:
-            recommendations.append("Add SQL expressions for common dimensions (e.g., date parts, categories)")
+            recommendations.append(
+                "Add SQL expressions for common dimensions (e.g., date parts, categories)"
+            )
 
         # Join recommendations
         if table_count > 1:
@@ -1,13 +1,23 @@
 """Configuration generation tools for MCP server."""
 
-import json
-from typing import Optional
+import asyncio
+from collections.abc import Sequence
+from typing import Any, Optional
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.sql import StatementParameterListItem, StatementState
 
+from genie_mcp_server.generators.schema_reference import (
+    load_schema_reference,
+    render_schema_reference,
+    write_schema_reference,
+)
 from genie_mcp_server.generators.space_config_generator import GenieConfigGenerator
 from genie_mcp_server.generators.validator import ConfigValidator
 from genie_mcp_server.models.responses import TableMetadata
+from genie_mcp_server.models.space import LLMResponse
+from genie_mcp_server.utils.cache import TTLCache
+from genie_mcp_server.utils.json_utils import dumps
 
 # Global instances - will be set by server.py
 _workspace_client: Optional[WorkspaceClient] = None
@@ -15,17 +25,22 @@ _config_generator: Optional[GenieConfigGenerator] = None
 _config_validator: Optional[ConfigValidator] = None
 
 
-def set_workspace_client(client: WorkspaceClient, serving_endpoint_name: str) -> None:
+def set_workspace_client(
+    client: WorkspaceClient, serving_endpoint_name: str, prompt_caching: bool = False
+) -> None:
     """Set the global workspace client and initialize generator.
 
     Args:
         client: WorkspaceClient instance
         serving_endpoint_name: Name of the serving endpoint for LLM calls
+        prompt_caching: Mark the static prompt prefix as cacheable in LLM requests
     """
     global _workspace_client, _config_generator, _config_validator
     _workspace_client = client
     _config_generator = GenieConfigGenerator(
-        workspace_client=client, serving_endpoint_name=serving_endpoint_name
+        workspace_client=client,
+        serving_endpoint_name=serving_endpoint_name,
+        prompt_caching=prompt_caching,
     )
     _config_validator = ConfigValidator()
 
@@ -57,6 +72,7 @@ def generate_space_config(
     catalog_name: str,
     serving_endpoint_name: Optional[str] = None,
     validate_sql: bool = True,
+    schema_name: Optional[str] = None,
 ) -> str:
     """Generate a Genie space configuration from natural language requirements.
 
@@ -69,28 +85,65 @@ def generate_space_config(
         catalog_name: Unity Catalog name to use
         serving_endpoint_name: Optional serving endpoint name (uses default if not provided)
         validate_sql: Whether to validate SQL syntax (default: True)
+        schema_name: Schema the space targets; a fresh schema reference written
+            by init_schema_reference for this catalog.schema is used as table context
 
     Returns:
         JSON string with generated configuration, reasoning, confidence score,
         validation report, and warnings
     """
     generator = get_config_generator()
-    validator = get_config_validator()
 
-    # Generate configuration
     llm_response = generator.generate_config(
         requirements=requirements,
         catalog_name=catalog_name,
         warehouse_id=warehouse_id,
+        table_metadata=_schema_context(catalog_name, schema_name),
     )
 
-    # Validate configuration
-    config_dict = llm_response.genie_space_config.model_dump()
-    validation_report = validator.validate_config(config_dict, validate_sql=validate_sql)
+    return _generation_result(llm_response, validate_sql)
+
+
+async def agenerate_space_config(
+    requirements: str,
+    warehouse_id: str,
+    catalog_name: str,
+    serving_endpoint_name: Optional[str] = None,
+    validate_sql: bool = True,
+    schema_name: Optional[str] = None,
+) -> str:
+    """Async variant of generate_space_config using the pooled async HTTP client."""
+    generator = get_config_generator()
+
+    table_metadata = await asyncio.to_thread(_schema_context, catalog_name, schema_name)
+    llm_response = await generator.agenerate_config(
+        requirements=requirements,
+        catalog_name=catalog_name,
+        warehouse_id=warehouse_id,
+        table_metadata=table_metadata,
+    )
+
+    return await asyncio.to_thread(_generation_result, llm_response, validate_sql)
+
+
+def _schema_context(catalog_name: str, schema_name: Optional[str]) -> Optional[str]:
+    """Return the on-disk schema reference for catalog.schema, if fresh."""
+    if not schema_name:
+        return None
+    return load_schema_reference(catalog_name, schema_name)
+
+
+def _generation_result(llm_response: LLMResponse, validate_sql: bool) -> str:
+    """Validate a generated configuration and build the tool response."""
+    validator = get_config_validator()
+
+    # The generated config is already a validated model, so only the quality checks run
+    config = llm_response.genie_space_config
+    validation_report = validator.validate_model(config, validate_sql=validate_sql)
 
     # Build response
     result = {
-        "genie_space_config": config_dict,
+        "genie_space_config": config.model_dump(),
         "reasoning": llm_response.reasoning,
         "confidence_score": llm_response.confidence_score,
         "validation_report": {
@@ -101,7 +154,7 @@ def generate_space_config(
         },
     }
 
-    return json.dumps(result, indent=2)
+    return dumps(result, indent=True)
 
 
 def validate_space_config(
@@ -125,15 +178,9 @@ def validate_space_config(
     """
     validator = get_config_validator()
 
-    try:
-        config_dict = json.loads(config)
-    except json.JSONDecodeError as e:
-        return json.dumps(
-            {"valid": False, "errors": [f"Invalid JSON: {str(e)}"], "warnings": [], "score": 0},
-            indent=2,
-        )
-
-    validation_report = validator.validate_config(config_dict, validate_sql=validate_sql)
+    # Parsed straight into the model; the result is reused if the same JSON is
+    # then passed to create_genie_space
+    validation_report = validator.validate_json_string(config, validate_sql=validate_sql)
 
     result = {
         "valid": validation_report.valid,
@@ -142,11 +189,190 @@ def validate_space_config(
         "score": validation_report.score,
     }
 
-    return json.dumps(result, indent=2)
+    return dumps(result, indent=True)
+
+
+# information_schema IN-lists are chunked to keep statements well under size limits
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+_TABLE_METADATA_SQL = """
+SELECT c.table_name, t.table_type, t.comment, t.table_owner,
+       c.column_name, c.full_data_type, c.comment
+FROM system.information_schema.columns c
+JOIN system.information_schema.tables t
+  ON t.table_catalog = c.table_catalog
+ AND t.table_schema = c.table_schema
+ AND t.table_name = c.table_name
+WHERE c.table_catalog = :catalog_name AND c.table_schema = :schema_name{table_filter}
+ORDER BY c.table_name, c.ordinal_position
+"""
+
+# Table metadata keyed by (catalog, schema, frozenset(table_names) or None)
+_table_metadata_cache = TTLCache(maxsize=128, ttl_seconds=300.0)
+
+
+def _query_table_metadata(
+    client: WorkspaceClient,
+    warehouse_id: str,
+    catalog_name: str,
+    schema_name: str,
+    table_names: Optional[Sequence[str]],
+) -> list[dict[str, Any]]:
+    """Fetch table and column metadata with batched information_schema queries.
+
+    Issues one statement per chunk of up to ``_IN_CLAUSE_CHUNK_SIZE`` table names
+    (a single statement when no filter is given) and groups the flat column rows
+    by table in one pass.
+    """
+    if table_names:
+        chunks = [
+            table_names[i : i + _IN_CLAUSE_CHUNK_SIZE]
+            for i in range(0, len(table_names), _IN_CLAUSE_CHUNK_SIZE)
+        ]
+    else:
+        chunks = [None]
+
+    tables: dict[str, dict[str, Any]] = {}
+    for chunk in chunks:
+        parameters = [
+            StatementParameterListItem(name="catalog_name", value=catalog_name),
+            StatementParameterListItem(name="schema_name", value=schema_name),
+        ]
+        table_filter = ""
+        if chunk:
+            placeholders = ", ".join(f":t{i}" for i in range(len(chunk)))
+            table_filter = f" AND c.table_name IN ({placeholders})"
+            parameters.extend(
+                StatementParameterListItem(name=f"t{i}", value=name) for i, name in enumerate(chunk)
+            )
+
+        response = client.statement_execution.execute_statement(
+            statement=_TABLE_METADATA_SQL.format(table_filter=table_filter),
+            warehouse_id=warehouse_id,
+            parameters=parameters,
+            wait_timeout="50s",
+        )
+        state = response.status.state if response.status else None
+        if state != StatementState.SUCCEEDED:
+            error = response.status.error if response.status else None
+            message = error.message if error else f"statement ended in state {state}"
+            raise RuntimeError(message)
+
+        result = response.result
+        while result is not None:
+            for table_name, table_type, table_comment, owner, column, data_type, comment in (
+                result.data_array or []
+            ):
+                table = tables.get(table_name)
+                if table is None:
+                    table = tables[table_name] = TableMetadata(
+                        catalog_name=catalog_name,
+                        schema_name=schema_name,
+                        table_name=table_name,
+                        table_type=table_type,
+                        comment=table_comment,
+                        owner=owner,
+                    ).model_dump()
+                table["columns"].append({"name": column, "type": data_type, "comment": comment})
+
+            if result.next_chunk_index is None:
+                break
+            result = client.statement_execution.get_statement_result_chunk_n(
+                response.statement_id, result.next_chunk_index
+            )
+
+    return list(tables.values())
+
+
+def _list_table_metadata(
+    client: WorkspaceClient,
+    catalog_name: str,
+    schema_name: str,
+    table_names: Optional[Sequence[str]],
+) -> list[dict[str, Any]]:
+    """Fetch table and column metadata from the Unity Catalog tables listing.
+
+    The listing already carries column definitions, so a per-table ``tables.get``
+    is only issued for entries that come back without them.
+    """
+    wanted = set(table_names) if table_names else None
+    tables = []
+
+    for table in client.tables.list(catalog_name=catalog_name, schema_name=schema_name):
+        # Filter by table names if provided
+        if wanted is not None and table.name not in wanted:
+            continue
+
+        table_info = table
+        if not table_info.columns:
+            table_info = client.tables.get(full_name=f"{catalog_name}.{schema_name}.{table.name}")
+
+        # Extract column information
+        columns = []
+        for col in table_info.columns or []:
+            columns.append(
+                {
+                    "name": col.name,
+                    "type": getattr(col, "type_text", getattr(col, "type_name", "UNKNOWN")),
+                    "comment": getattr(col, "comment", None),
+                }
+            )
+
+        table_type = getattr(table, "table_type", None)
+        metadata = TableMetadata(
+            catalog_name=catalog_name,
+            schema_name=schema_name,
+            table_name=table.name,
+            table_type=table_type.value if table_type is not None else None,
+            comment=getattr(table_info, "comment", None),
+            columns=columns,
+            owner=getattr(table_info, "owner", None),
+        )
+
+        tables.append(metadata.model_dump())
+
+    return tables
+
+
+def fetch_table_metadata(
+    catalog_name: str,
+    schema_name: str,
+    table_names: Optional[Sequence[str]] = None,
+    warehouse_id: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Fetch metadata for Unity Catalog tables, served from a 5 minute cache.
+
+    Args:
+        catalog_name: Catalog name in Unity Catalog
+        schema_name: Schema name in Unity Catalog
+        table_names: Optional list of specific table names to include (default: all tables in schema)
+        warehouse_id: Optional SQL warehouse ID; when given, metadata is read with a
+            single batched information_schema query instead of the tables API
+
+    Returns:
+        List of table metadata dictionaries
+    """
+    key = (catalog_name, schema_name, frozenset(table_names) if table_names else None)
+    try:
+        return _table_metadata_cache[key]
+    except KeyError:
+        pass
+
+    client = get_workspace_client()
+    if warehouse_id:
+        tables = _query_table_metadata(client, warehouse_id, catalog_name, schema_name, table_names)
+    else:
+        tables = _list_table_metadata(client, catalog_name, schema_name, table_names)
+
+    _table_metadata_cache[key] = tables
+    return tables
 
 
 def extract_table_metadata(
-    catalog_name: str, schema_name: str, table_names: Optional[list[str]] = None
+    catalog_name: str,
+    schema_name: str,
+    table_names: Optional[Sequence[str]] = None,
+    warehouse_id: Optional[str] = None,
 ) -> str:
     """Extract metadata for Unity Catalog tables.
 
@@ -157,55 +383,49 @@ def extract_table_metadata(
         catalog_name: Catalog name in Unity Catalog
         schema_name: Schema name in Unity Catalog
         table_names: Optional list of specific table names to include (default: all tables in schema)
+        warehouse_id: Optional SQL warehouse ID to read metadata with one batched query
 
     Returns:
         JSON string with table metadata including columns, types, and descriptions
     """
-    client = get_workspace_client()
-
     try:
-        tables = []
+        tables = fetch_table_metadata(catalog_name, schema_name, table_names, warehouse_id)
+
+        result = {"catalog_name": catalog_name, "schema_name": schema_name, "tables": tables}
 
-        # List tables in schema
-        table_list = client.tables.list(catalog_name=catalog_name, schema_name=schema_name)
+        return dumps(result, indent=True)
 
-        for table in table_list:
-            # Filter by table names if provided
-            if table_names and table.name not in table_names:
-                continue
+    except Exception as e:
+        return dumps({"error": f"Failed to extract table metadata: {str(e)}"}, indent=True)
 
-            # Get full table info
-            table_info = client.tables.get(
-                full_name=f"{catalog_name}.{schema_name}.{table.name}"
-            )
 
-            # Extract column information
-            columns = []
-            if hasattr(table_info, "columns") and table_info.columns:
-                for col in table_info.columns:
-                    columns.append(
-                        {
-                            "name": col.name,
-                            "type": getattr(col, "type_text", getattr(col, "type_name", "UNKNOWN")),
-                            "comment": getattr(col, "comment", None),
-                        }
-                    )
-
-            metadata = TableMetadata(
-                catalog_name=catalog_name,
-                schema_name=schema_name,
-                table_name=table.name,
-                table_type=getattr(table, "table_type", None),
-                comment=getattr(table_info, "comment", None),
-                columns=columns,
-                owner=getattr(table_info, "owner", None),
-            )
+def init_schema_reference(
+    catalog_name: str,
+    schema_name: str,
+    warehouse_id: Optional[str] = None,
+) -> str:
+    """Write a Markdown schema reference for a schema to disk.
 
-            tables.append(metadata.model_dump())
+    Later config generation reads this file as table context instead of
+    re-discovering the schema. References older than 24 hours are ignored, so
+    re-run this tool to refresh.
 
-        result = {"catalog_name": catalog_name, "schema_name": schema_name, "tables": tables}
+    Args:
+        catalog_name: Catalog name in Unity Catalog
+        schema_name: Schema name in Unity Catalog
+        warehouse_id: Optional SQL warehouse ID to read metadata with one batched query
+
+    Returns:
+        JSON string with the written path and table count
+    """
+    try:
+        tables = fetch_table_metadata(catalog_name, schema_name, warehouse_id=warehouse_id)
+        content = render_schema_reference(catalog_name, schema_name, tables)
+        path = write_schema_reference(content)
+
+        result = {"status": "success", "path": str(path), "table_count": len(tables)}
 
-        return json.dumps(result, indent=2)
+        return dumps(result, indent=True)
 
     except Exception as e:
-        return json.dumps({"error": f"Failed to extract table metadata: {str(e)}"}, indent=2)
+        return dumps({"error": f"Failed to initialize schema reference: {str(e)}"}, indent=True)
@@ -1,27 +1,51 @@
 """Genie conversation and query tools for MCP server."""
 
 import asyncio
-import json
+import io
+import posixpath
+import uuid
 from typing import Any, Optional
 
 from databricks.sdk import WorkspaceClient
 
 from genie_mcp_server.client.polling import poll_until_complete
-from genie_mcp_server.utils.error_handling import translate_databricks_error
+from genie_mcp_server.utils.cache import TTLCache
+from genie_mcp_server.utils.error_handling import ValidationError, translate_databricks_error
+from genie_mcp_server.utils.json_utils import dumps, dumps_bytes, loads
 from genie_mcp_server.utils.rate_limiter import genie_rate_limiter
 
+# Backoff schedule for polling Genie messages: the first check comes quickly so
+# short questions return fast, then the wait grows until it reaches the cap
+POLL_MIN_INTERVAL_SECONDS = 0.3
+POLL_MAX_INTERVAL_SECONDS = 5.0
+POLL_BACKOFF_FACTOR = 1.3
+
+# Completed ask_genie answers keyed by (space_id, normalized question)
+_answer_cache = TTLCache(maxsize=1024, ttl_seconds=300.0)
+
+# Query results larger than this are written to the results volume, when one
+# is configured, and only a preview is returned inline
+QUERY_RESULTS_OFFLOAD_BYTES = 256 * 1024
+QUERY_RESULTS_PREVIEW_ROWS = 20
+
 # Global client instance - will be set by server.py
 _workspace_client: Optional[WorkspaceClient] = None
+_results_volume_path: Optional[str] = None
 
 
-def set_workspace_client(client: WorkspaceClient) -> None:
+def set_workspace_client(
+    client: WorkspaceClient, results_volume_path: Optional[str] = None
+) -> None:
     """Set the global workspace client instance.
 
     Args:
         client: WorkspaceClient instance to use for all tool operations
+        results_volume_path: Optional Unity Catalog volume directory
+            (/Volumes/catalog/schema/volume/...) for offloading large query results
     """
-    global _workspace_client
+    global _workspace_client, _results_volume_path
     _workspace_client = client
+    _results_volume_path = posixpath.normpath(results_volume_path) if results_volume_path else None
 
 
 def get_workspace_client() -> WorkspaceClient:
@@ -38,27 +62,59 @@ def get_workspace_client() -> WorkspaceClient:
     return _workspace_client
 
 
+def _poll_schedule(poll_interval_seconds: Optional[float]) -> dict[str, float]:
+    """Return poll_until_complete arguments for a fixed interval or the default backoff."""
+    if poll_interval_seconds is not None:
+        return {
+            "poll_interval_seconds": poll_interval_seconds,
+            "max_interval_seconds": poll_interval_seconds,
+            "backoff_factor": 1.0,
+        }
+    return {
+        "poll_interval_seconds": POLL_MIN_INTERVAL_SECONDS,
+        "max_interval_seconds": POLL_MAX_INTERVAL_SECONDS,
+        "backoff_factor": POLL_BACKOFF_FACTOR,
+    }
+
+
+def _answer_key(space_id: str, question: str) -> tuple[str, str]:
+    """Cache key for a question, ignoring case and whitespace differences."""
+    return space_id, " ".join(question.split()).casefold()
+
+
 async def ask_genie(
     space_id: str,
     question: str,
     timeout_seconds: int = 300,
-    poll_interval_seconds: int = 2,
+    poll_interval_seconds: Optional[float] = None,
+    use_cache: bool = True,
 ) -> str:
     """Ask a question to Genie and wait for the response.
 
     This tool applies rate limiting (5 queries per minute) and polls until
-    the query completes or times out.
+    the query completes or times out. Completed answers are cached for 5
+    minutes, so asking the same question again returns the earlier answer
+    without starting a new conversation.
 
     Args:
         space_id: Unique identifier for the Genie space
         question: Natural language question to ask
         timeout_seconds: Maximum time to wait for response (default: 300)
-        poll_interval_seconds: Time between status checks (default: 2)
+        poll_interval_seconds: Fixed time between status checks; by default the
+            wait backs off from 0.3s up to 5s
+        use_cache: Return a recent answer to the same question if there is one
 
     Returns:
         JSON string with conversation_id, message_id, status, response_text,
         sql_query, and query_results if available
     """
+    key = _answer_key(space_id, question)
+    if use_cache:
+        try:
+            return _answer_cache[key]
+        except KeyError:
+            pass
+
     client = get_workspace_client()
 
     try:
@@ -66,16 +122,22 @@ async def ask_genie(
         await genie_rate_limiter.acquire()
 
         # Start conversation
-        conversation = client.genie.start_conversation(space_id=space_id, content=question)
+        conversation = await asyncio.to_thread(
+            client.genie.start_conversation, space_id=space_id, content=question
+        )
 
         conversation_id = conversation.conversation_id
         message_id = conversation.message_id
 
         # Poll for completion
         def check_status() -> tuple[bool, dict[str, Any]]:
-            message = client.genie.get_message(space_id=space_id, conversation_id=conversation_id, message_id=message_id)
+            message = client.genie.get_message(
+                space_id=space_id, conversation_id=conversation_id, message_id=message_id
+            )
 
-            status = message.status.value if hasattr(message.status, "value") else str(message.status)
+            status = (
+                message.status.value if hasattr(message.status, "value") else str(message.status)
+            )
 
             # Check if completed or failed
             if status in ["COMPLETED", "FAILED", "CANCELLED"]:
@@ -116,10 +178,13 @@ async def ask_genie(
         result = await poll_until_complete(
             check_fn=check_status,
             timeout_seconds=timeout_seconds,
-            poll_interval_seconds=poll_interval_seconds,
+            **_poll_schedule(poll_interval_seconds),
         )
 
-        return json.dumps(result, indent=2)
+        answer = dumps(result, indent=True)
+        if result["status"] == "COMPLETED":
+            _answer_cache[key] = answer
+        return answer
 
     except Exception as e:
         raise translate_databricks_error(e)
@@ -130,7 +195,7 @@ async def continue_conversation(
     conversation_id: str,
     question: str,
     timeout_seconds: int = 300,
-    poll_interval_seconds: int = 2,
+    poll_interval_seconds: Optional[float] = None,
 ) -> str:
     """Continue an existing conversation with a follow-up question.
 
@@ -139,7 +204,8 @@ async def continue_conversation(
         conversation_id: ID of the conversation to continue
         question: Follow-up question
         timeout_seconds: Maximum time to wait for response (default: 300)
-        poll_interval_seconds: Time between status checks (default: 2)
+        poll_interval_seconds: Fixed time between status checks; by default the
+            wait backs off from 0.3s up to 5s
 
     Returns:
         JSON string with message details and results
@@ -151,8 +217,11 @@ async def continue_conversation(
         await genie_rate_limiter.acquire()
 
         # Send follow-up message
-        message = client.genie.create_message(
-            space_id=space_id, conversation_id=conversation_id, content=question
+        message = await asyncio.to_thread(
+            client.genie.create_message,
+            space_id=space_id,
+            conversation_id=conversation_id,
+            content=question,
         )
 
         message_id = message.message_id
@@ -199,10 +268,10 @@ async def continue_conversation(
         result = await poll_until_complete(
             check_fn=check_status,
             timeout_seconds=timeout_seconds,
-            poll_interval_seconds=poll_interval_seconds,
+            **_poll_schedule(poll_interval_seconds),
         )
 
-        return json.dumps(result, indent=2)
+        return dumps(result, indent=True)
 
     except Exception as e:
         raise translate_databricks_error(e)
@@ -220,7 +289,10 @@ def get_query_results(
         attachment_id: Optional specific attachment ID
 
     Returns:
-        JSON string with query results (up to 5,000 rows)
+        JSON string with query results (up to 5,000 rows). If a results volume
+        is configured and the results are larger than 256 KiB, they are written
+        to a file there and only the first rows are returned, together with
+        the file path for fetch_query_results_file
     """
     client = get_workspace_client()
 
@@ -230,15 +302,78 @@ def get_query_results(
         )
 
         result = _format_query_result(query_result)
-        return json.dumps(result, indent=2)
+        if _results_volume_path is not None:
+            payload = dumps_bytes(result)
+            if len(payload) > QUERY_RESULTS_OFFLOAD_BYTES:
+                path = f"{_results_volume_path}/{uuid.uuid4().hex}.json"
+                client.files.upload(path, io.BytesIO(payload), overwrite=True)
+                return dumps(
+                    {
+                        "schema": result["schema"],
+                        "rows": result["rows"][:QUERY_RESULTS_PREVIEW_ROWS],
+                        "row_count": result.get("row_count", 0),
+                        "truncated": True,
+                        "full_results_path": path,
+                        "bytes": len(payload),
+                    },
+                    indent=True,
+                )
+
+        return dumps(result, indent=True)
 
     except Exception as e:
         raise translate_databricks_error(e)
 
 
-def list_conversations(
-    space_id: str, page_size: int = 50, page_token: Optional[str] = None
-) -> str:
+def fetch_query_results_file(path: str, offset: int = 0, limit: int = 500) -> str:
+    """Read a page of rows from query results offloaded by get_query_results.
+
+    Args:
+        path: full_results_path returned by get_query_results
+        offset: Index of the first row to return (default: 0)
+        limit: Maximum number of rows to return (default: 500)
+
+    Returns:
+        JSON string with the schema, the requested rows, and the total row count
+
+    Raises:
+        ValidationError: If no results volume is configured, the path is not
+            a file in it, or offset/limit are out of range
+    """
+    if _results_volume_path is None:
+        raise ValidationError("No query results volume is configured")
+    # Only files written by get_query_results may be read back
+    path = posixpath.normpath(path)
+    if posixpath.dirname(path) != _results_volume_path:
+        raise ValidationError(f"Path is not in the query results volume: {path}")
+    if offset < 0:
+        raise ValidationError("offset must be >= 0")
+    if limit <= 0:
+        raise ValidationError("limit must be > 0")
+
+    client = get_workspace_client()
+
+    try:
+        contents = client.files.download(path).contents
+        with contents:
+            result = loads(contents.read())
+
+        rows = result["rows"]
+        return dumps(
+            {
+                "schema": result["schema"],
+                "rows": rows[offset : offset + limit],
+                "offset": offset,
+                "row_count": len(rows),
+            },
+            indent=True,
+        )
+
+    except Exception as e:
+        raise translate_databricks_error(e)
+
+
+def list_conversations(space_id: str, page_size: int = 50, page_token: Optional[str] = None) -> str:
     """List conversations in a Genie space.
 
     Args:
@@ -268,8 +403,8 @@ def list_conversations(
                 }
             )
 
-        return json.dumps(
-            {"conversations": conversations, "next_page_token": result.next_page_token}, indent=2
+        return dumps(
+            {"conversations": conversations, "next_page_token": result.next_page_token}, indent=True
         )
 
     except Exception as e:
@@ -298,21 +433,21 @@ def get_conversation_history(space_id: str, conversation_id: str) -> str:
                     {
                         "message_id": msg.message_id,
                         "content": getattr(msg, "content", None),
-                        "status": msg.status.value
-                        if hasattr(msg.status, "value")
-                        else str(msg.status),
+                        "status": (
+                            msg.status.value if hasattr(msg.status, "value") else str(msg.status)
+                        ),
                         "created_timestamp": getattr(msg, "created_timestamp", None),
                     }
                 )
 
-        return json.dumps(
+        return dumps(
             {
                 "conversation_id": conversation_id,
                 "space_id": space_id,
                 "title": getattr(result, "title", None),
                 "messages": messages,
             },
-            indent=2,
+            indent=True,
         )
 
     except Exception as e:
@@ -1,13 +1,15 @@
 """Genie space management tools for MCP server."""
 
-import json
 from typing import Optional
 
+from genie_mcp_server.client.async_genie_client import AsyncGenieClient
 from genie_mcp_server.client.genie_client import GenieClient
-from genie_mcp_server.models.space import GenieSpaceConfig
+from genie_mcp_server.models.space import parse_space_config
+from genie_mcp_server.utils.json_utils import dumps
 
-# Global client instance - will be set by server.py
+# Global client instances - will be set by server.py
 _genie_client: Optional[GenieClient] = None
+_async_genie_client: Optional[AsyncGenieClient] = None
 
 
 def set_genie_client(client: GenieClient) -> None:
@@ -34,6 +36,34 @@ def get_genie_client() -> GenieClient:
     return _genie_client
 
 
+def set_async_genie_client(client: Optional[AsyncGenieClient]) -> Optional[AsyncGenieClient]:
+    """Set the global async Genie client instance.
+
+    Args:
+        client: AsyncGenieClient instance used by the async tool variants, or None to unset
+
+    Returns:
+        The previously set client, so callers can restore it
+    """
+    global _async_genie_client
+    previous, _async_genie_client = _async_genie_client, client
+    return previous
+
+
+def get_async_genie_client() -> AsyncGenieClient:
+    """Get the global async Genie client instance.
+
+    Returns:
+        AsyncGenieClient instance
+
+    Raises:
+        RuntimeError: If client not initialized
+    """
+    if _async_genie_client is None:
+        raise RuntimeError("Async Genie client not initialized. Call set_async_genie_client first.")
+    return _async_genie_client
+
+
 def create_genie_space(
     warehouse_id: str,
     config_json: str,
@@ -59,9 +89,8 @@ def create_genie_space(
     """
     client = get_genie_client()
 
-    # Parse the config JSON into a Pydantic model
-    config_dict = json.loads(config_json)
-    config = GenieSpaceConfig(**config_dict)
+    # Parse and validate the config JSON in a single pass
+    config = parse_space_config(config_json)
 
     result = client.create_space(
         warehouse_id=warehouse_id,
@@ -70,7 +99,7 @@ def create_genie_space(
         description=description,
         parent_path=parent_path,
     )
-    return json.dumps(result, indent=2)
+    return dumps(result, indent=True)
 
 
 def list_genie_spaces(page_size: Optional[int] = None, page_token: Optional[str] = None) -> str:
@@ -85,7 +114,7 @@ def list_genie_spaces(page_size: Optional[int] = None, page_token: Optional[str]
     """
     client = get_genie_client()
     result = client.list_spaces(page_size=page_size, page_token=page_token)
-    return json.dumps(result, indent=2)
+    return dumps(result, indent=True)
 
 
 def get_genie_space(space_id: str, include_config: bool = False) -> str:
@@ -104,7 +133,7 @@ def get_genie_space(space_id: str, include_config: bool = False) -> str:
     """
     client = get_genie_client()
     result = client.get_space(space_id=space_id, include_serialized_space=include_config)
-    return json.dumps(result, indent=2)
+    return dumps(result, indent=True)
 
 
 def update_genie_space(
@@ -134,8 +163,7 @@ def update_genie_space(
 
     config = None
     if config_json:
-        config_dict = json.loads(config_json)
-        config = GenieSpaceConfig(**config_dict)
+        config = parse_space_config(config_json)
 
     result = client.update_space(
         space_id=space_id,
@@ -144,7 +172,7 @@ def update_genie_space(
         description=description,
         warehouse_id=warehouse_id,
     )
-    return json.dumps(result, indent=2)
+    return dumps(result, indent=True)
 
 
 def delete_genie_space(space_id: str) -> str:
@@ -158,4 +186,73 @@ def delete_genie_space(space_id: str) -> str:
     """
     client = get_genie_client()
     result = client.delete_space(space_id=space_id)
-    return json.dumps(result, indent=2)
+    return dumps(result, indent=True)
+
+
+async def acreate_genie_space(
+    warehouse_id: str,
+    config_json: str,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    parent_path: Optional[str] = None,
+) -> str:
+    """Async variant of create_genie_space using the pooled HTTP client."""
+    client = get_async_genie_client()
+
+    config = parse_space_config(config_json)
+
+    result = await client.create_space(
+        warehouse_id=warehouse_id,
+        config=config,
+        title=title,
+        description=description,
+        parent_path=parent_path,
+    )
+    return dumps(result, indent=True)
+
+
+async def alist_genie_spaces(
+    page_size: Optional[int] = None, page_token: Optional[str] = None
+) -> str:
+    """Async variant of list_genie_spaces using the pooled HTTP client."""
+    client = get_async_genie_client()
+    result = await client.list_spaces(page_size=page_size, page_token=page_token)
+    return dumps(result, indent=True)
+
+
+async def aget_genie_space(space_id: str, include_config: bool = False) -> str:
+    """Async variant of get_genie_space using the pooled HTTP client."""
+    client = get_async_genie_client()
+    result = await client.get_space(space_id=space_id, include_serialized_space=include_config)
+    return dumps(result, indent=True)
+
+
+async def aupdate_genie_space(
+    space_id: str,
+    config_json: Optional[str] = None,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    warehouse_id: Optional[str] = None,
+) -> str:
+    """Async variant of update_genie_space using the pooled HTTP client."""
+    client = get_async_genie_client()
+
+    config = None
+    if config_json:
+        config = parse_space_config(config_json)
+
+    result = await client.update_space(
+        space_id=space_id,
+        config=config,
+        title=title,
+        description=description,
+        warehouse_id=warehouse_id,
+    )
+    return dumps(result, indent=True)
+
+
+async def adelete_genie_space(space_id: str) -> str:
+    """Async variant of delete_genie_space using the pooled HTTP client."""
+    client = get_async_genie_client()
+    result = await client.delete_space(space_id=space_id)
+    return dumps(result, indent=True)
@@ -0,0 +1,59 @@
+"""Fast JSON encoding and decoding backed by orjson.
+
+Falls back to the standard library json module, with matching output,
+when orjson is not installed (e.g. on platforms without a prebuilt wheel).
+"""
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+
+    # Raised by loads(); a subclass of json.JSONDecodeError
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize an object to a JSON string.
+
+        Args:
+            obj: Object to serialize
+            indent: Pretty-print with two-space indentation
+
+        Returns:
+            JSON string
+        """
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode("utf-8")
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes, e.g. for an HTTP body."""
+        return orjson.dumps(obj)
+
+else:
+    import json
+
+    loads = json.loads
+
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize an object to a JSON string.
+
+        Args:
+            obj: Object to serialize
+            indent: Pretty-print with two-space indentation
+
+        Returns:
+            JSON string
+        """
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes, e.g. for an HTTP body."""
+        return dumps(obj).encode("utf-8")
@@ -1,14 +1,19 @@
 """Rate limiting utilities for Genie API calls."""
 
 import asyncio
+import threading
 import time
 from collections import deque
 
 
 class RateLimiter:
-    """Token bucket rate limiter for Genie API calls.
+    """Sliding-window rate limiter for Genie API calls.
 
     Genie API limits: 5 queries per minute in Public Preview.
+
+    Each caller reserves the earliest free slot and then sleeps until it
+    comes up, so waiting callers do not hold a lock and queue behind each
+    other. The limiter can be shared between event loops and threads.
     """
 
     def __init__(self, max_requests: int = 5, window_seconds: int = 60):
@@ -20,38 +25,65 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        # Start times of recent and reserved requests, in order
         self.requests: deque[float] = deque()
-        self._lock = asyncio.Lock()
+        self._lock = threading.Lock()
 
-    async def acquire(self) -> None:
-        """Acquire permission to make a request, blocking if rate limit reached.
+    def reserve(self) -> float:
+        """Reserve the next request slot.
 
-        This method will wait if necessary until a request slot is available.
+        Returns:
+            time.monotonic() time at which the reserved request may be sent
         """
-        async with self._lock:
-            now = time.time()
+        with self._lock:
+            now = time.monotonic()
 
             # Remove requests outside the current window
             while self.requests and self.requests[0] <= now - self.window_seconds:
                 self.requests.popleft()
 
-            # If at limit, wait until the oldest request expires
+            # If at limit, the slot opens one window after the request
+            # max_requests places back
+            slot = now
             if len(self.requests) >= self.max_requests:
-                oldest_request = self.requests[0]
-                wait_time = self.window_seconds - (now - oldest_request)
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
-                    # Clean up again after waiting
-                    now = time.time()
-                    while self.requests and self.requests[0] <= now - self.window_seconds:
-                        self.requests.popleft()
-
-            # Record this request
-            self.requests.append(time.time())
+                slot = max(now, self.requests[-self.max_requests] + self.window_seconds)
+
+            self.requests.append(slot)
+            return slot
+
+    def release(self, slot: float) -> None:
+        """Give back a reserved slot whose request will not be sent.
+
+        Args:
+            slot: Slot time returned by reserve()
+        """
+        with self._lock:
+            try:
+                self.requests.remove(slot)
+            except ValueError:
+                # Already cleared by reset()
+                pass
+
+    async def acquire(self) -> None:
+        """Acquire permission to make a request, blocking if rate limit reached.
+
+        This method will wait if necessary until a request slot is available.
+        If the wait is cancelled, the reserved slot is released so it does
+        not count toward the limit.
+        """
+        slot = self.reserve()
+        wait_time = slot - time.monotonic()
+        if wait_time > 0:
+            try:
+                await asyncio.sleep(wait_time)
+            except asyncio.CancelledError:
+                self.release(slot)
+                raise
 
     def reset(self) -> None:
         """Reset the rate limiter, clearing all tracked requests."""
-        self.requests.clear()
+        with self._lock:
+            self.requests.clear()
 
 
 # Global rate limiter instance for Genie API calls